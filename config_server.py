@@ -358,6 +358,12 @@ class FunASRNanoGGUFArgs:
         "fun_asr_nano", "onnx_padding_secs",
         default=30
     )
+    # CPU 推理的 ORT 图优化级别：0/1/2/99（99 为全量，部分 CPU 上反而更慢）
+    onnx_graph_opt_level = _cfg_int(
+        "CAPSWRITER_ONNX_GRAPH_OPT_LEVEL",
+        "fun_asr_nano", "onnx_graph_opt_level",
+        default=2
+    )
 
     # 设备模式兜底：允许一键切 CPU-only 或 GPU-preferred
     if device_mode == "cpu":
@@ -17,6 +17,7 @@ from contextlib import contextmanager
 from typing import Optional
 import pyclip
 from pynput import keyboard
+from util.client.shortcut.key_mapper import get_keyboard_controller
 from . import logger
 
 
@@ -277,7 +278,7 @@ async def paste_text(
             await asyncio.sleep(max(0.0, pre_delay_ms / 1000.0))
 
         # 粘贴结果（使用 pynput 模拟 Ctrl+V）
-        controller = keyboard.Controller()
+        controller = get_keyboard_controller()
         if platform.system() == 'Darwin':
             # macOS: Command+V
             with controller.pressed(keyboard.Key.cmd):
@@ -370,15 +370,24 @@ class ResultProcessor:
             self._cleanup()
 
     async def _handle_message(self, message: str) -> None:
-        """处理接收到的消息"""
+        """处理接收到的消息（兼容服务端合并下发的 JSON 数组帧）"""
         import json
-        
+
         # 再次检查退出标志
         if lifecycle.is_shutting_down:
             return
 
-        message = json.loads(message)
+        parsed = json.loads(message)
+
+        # 服务端可能把多条部分结果合并成一个数组帧一次下发
+        items = parsed if isinstance(parsed, list) else [parsed]
+        for item in items:
+            if lifecycle.is_shutting_down:
+                return
+            await self._handle_parsed(item)
 
+    async def _handle_parsed(self, message: dict) -> None:
+        """处理单条识别结果"""
         # 使用 text 字段（简单拼接结果，用于语音输入）
         text = message['text']
         original_text = text  # 保存原始识别结果
@@ -9,44 +9,67 @@ from __future__ import annotations
 
 import asyncio
 import platform
+import shutil
+import subprocess
 from typing import Optional
-import re
-
-from pynput import keyboard as pynput_keyboard
 
 from config_client import ClientConfig as Config
 from util.client.clipboard import paste_text
+from util.client.shortcut.key_mapper import get_keyboard_controller
 from . import logger
 
-if platform.system() == 'Windows':
+_SYSTEM = platform.system()
+
+if _SYSTEM == 'Windows':
     import keyboard as keyboard_lib
 else:
     keyboard_lib = None
 
+# Linux 下若存在 xdotool，整段文本一次批量注入，
+# 比 pynput 逐字符 press/release 更快且不易丢字；导入时探测一次。
+_XDOTOOL = shutil.which('xdotool') if _SYSTEM == 'Linux' else None
+
+
+
+# trash_punc 字符集缓存（config 支持热重载，按原始字符串作 key）
+_TRASH_PUNC_SOURCE = ""
+_TRASH_PUNC_SET: frozenset = frozenset()
+
+
+def _get_trash_punc_set(trash_punc: str) -> frozenset:
+    global _TRASH_PUNC_SOURCE, _TRASH_PUNC_SET
+    if trash_punc != _TRASH_PUNC_SOURCE:
+        _TRASH_PUNC_SOURCE = trash_punc
+        _TRASH_PUNC_SET = frozenset(trash_punc)
+    return _TRASH_PUNC_SET
 
 
 class TextOutput:
     """
     文本输出器
-    
+
     提供文本输出功能，支持模拟打字和粘贴两种方式。
     """
-    
+
     @staticmethod
     def strip_punc(text: str) -> str:
         """
         消除末尾最后一个标点
-        
+
+        trash_punc 是普通字符集合，无需正则：直接判末字符成员关系，
+        与原 `(?<=.)[...]$` 语义一致（标点为全文时不消除）。
+
         Args:
             text: 原始文本
-            
+
         Returns:
             去除末尾标点后的文本
         """
         if not text or not Config.trash_punc:
             return text
-        clean_text = re.sub(f"(?<=.)[{Config.trash_punc}]$", "", text)
-        return clean_text
+        if len(text) > 1 and text[-1] in _get_trash_punc_set(Config.trash_punc):
+            return text[:-1]
+        return text
     
     async def output(
         self,
@@ -103,7 +126,7 @@ class TextOutput:
 
         delay = max(0.0, float(char_interval_ms) / 1000.0)
         for ch in text:
-            self._type_text(ch)
+            self._type_char(ch)
             if delay > 0:
                 await asyncio.sleep(delay)
     
@@ -162,6 +185,24 @@ class TextOutput:
             restore_baseline_window_ms=profile_params["restore_baseline_window_ms"],
         )
     
+    @staticmethod
+    def _type_char(ch: str) -> None:
+        """
+        流式逐字输出单个字符。
+
+        xdotool/osascript 每次调用都是一次 fork+exec（毫秒级），只适合
+        整段批量注入；逐字流式若走子进程路径，每个字符都要起一个进程。
+        因此单字符固定走常驻注入器：Windows 用 keyboard.write，
+        其余平台复用共享的 pynput 控制器。
+
+        Args:
+            ch: 要输出的单个字符
+        """
+        if keyboard_lib is not None:
+            keyboard_lib.write(ch)
+            return
+        get_keyboard_controller().type(ch)
+
     def _type_text(self, text: str) -> None:
         """
         通过模拟打字方式输出文本
@@ -177,6 +218,35 @@ class TextOutput:
             keyboard_lib.write(text)
             return
 
-        # 非 Windows 场景回退到 pynput
-        controller = pynput_keyboard.Controller()
-        controller.type(text)
+        # Linux: xdotool 单次子进程批量注入整段文本
+        if _XDOTOOL is not None:
+            try:
+                subprocess.run(
+                    [_XDOTOOL, 'type', '--delay', '1', '--', text],
+                    check=True,
+                    timeout=10,
+                )
+                return
+            except Exception as e:
+                logger.debug(f"xdotool 输出失败，回退 pynput: {e}")
+
+        # macOS: osascript 批量 keystroke。System Events 的 keystroke
+        # 对 CJK 等非 ASCII 字符依赖当前输入法状态、经常丢字或乱码，
+        # 仅对纯 ASCII 文本启用，其余交给 pynput
+        if _SYSTEM == 'Darwin' and text.isascii():
+            try:
+                escaped = text.replace('\\', '\\\\').replace('"', '\\"')
+                subprocess.run(
+                    [
+                        'osascript', '-e',
+                        f'tell application "System Events" to keystroke "{escaped}"',
+                    ],
+                    check=True,
+                    timeout=10,
+                )
+                return
+            except Exception as e:
+                logger.debug(f"osascript 输出失败，回退 pynput: {e}")
+
+        # 其余场景回退到 pynput（复用共享控制器，避免每次输出都重建）
+        get_keyboard_controller().type(text)
@@ -8,6 +8,8 @@
 from __future__ import annotations
 
 import platform
+import threading
+from typing import Optional
 
 from pynput import keyboard
 
@@ -88,6 +90,23 @@ KEY_UP_MESSAGES = (WM_KEYUP, WM_SYSKEYUP)
 KEY_DOWN_MESSAGES = (WM_KEYDOWN, WM_SYSKEYDOWN)
 MOUSE_MESSAGES = (WM_XBUTTONDOWN, WM_XBUTTONUP)
 
+# 进程级共享的 pynput 键盘控制器。
+# Controller() 在 Windows 上需要加载 win32 模块并初始化状态，开销不小，
+# 按压/松开热路径上不应每次重建，统一复用单例。
+_CONTROLLER_LOCK = threading.Lock()
+_KEYBOARD_CONTROLLER: Optional[keyboard.Controller] = None
+
+
+def get_keyboard_controller() -> keyboard.Controller:
+    """获取共享的键盘控制器（首次访问时懒加载，线程安全）。"""
+    global _KEYBOARD_CONTROLLER
+    if _KEYBOARD_CONTROLLER is None:
+        with _CONTROLLER_LOCK:
+            if _KEYBOARD_CONTROLLER is None:
+                _KEYBOARD_CONTROLLER = keyboard.Controller()
+    return _KEYBOARD_CONTROLLER
+
+
 # 可恢复的切换键（需要录音完成后恢复状态的锁键）
 RESTORABLE_KEYS = {
     'caps_lock',
@@ -96,37 +115,34 @@ RESTORABLE_KEYS = {
 }
 
 
+# 按键名 -> pynput Key 对象映射。
+# Key 对象在 pynput 导入时即已存在，直接在模块导入时冻结字典，
+# 省去延迟初始化的判空分支。
+_SPECIAL_KEY_OBJECTS = {
+    'caps_lock': keyboard.Key.caps_lock,
+    'space': keyboard.Key.space,
+    'tab': keyboard.Key.tab,
+    'enter': keyboard.Key.enter,
+    'esc': keyboard.Key.esc,
+    'delete': keyboard.Key.delete,
+    'backspace': keyboard.Key.backspace,
+    'shift': keyboard.Key.shift,
+    'shift_r': getattr(keyboard.Key, 'shift_r', keyboard.Key.shift),
+    'ctrl': keyboard.Key.ctrl,
+    'ctrl_r': getattr(keyboard.Key, 'ctrl_r', keyboard.Key.ctrl),
+    'alt': keyboard.Key.alt,
+    'alt_r': getattr(keyboard.Key, 'alt_r', keyboard.Key.alt),
+    'cmd': keyboard.Key.cmd,
+    'cmd_r': getattr(keyboard.Key, 'cmd_r', keyboard.Key.cmd),
+    'f1': keyboard.Key.f1, 'f2': keyboard.Key.f2, 'f3': keyboard.Key.f3, 'f4': keyboard.Key.f4,
+    'f5': keyboard.Key.f5, 'f6': keyboard.Key.f6, 'f7': keyboard.Key.f7, 'f8': keyboard.Key.f8,
+    'f9': keyboard.Key.f9, 'f10': keyboard.Key.f10, 'f11': keyboard.Key.f11, 'f12': keyboard.Key.f12,
+}
+
+
 class KeyMapper:
     """按键映射器"""
 
-    _SPECIAL_KEY_OBJECTS = None
-
-    @classmethod
-    def _get_special_key_objects(cls):
-        """获取按键名 -> pynput Key 对象映射（延迟初始化）。"""
-        if cls._SPECIAL_KEY_OBJECTS is None:
-            cls._SPECIAL_KEY_OBJECTS = {
-                'caps_lock': keyboard.Key.caps_lock,
-                'space': keyboard.Key.space,
-                'tab': keyboard.Key.tab,
-                'enter': keyboard.Key.enter,
-                'esc': keyboard.Key.esc,
-                'delete': keyboard.Key.delete,
-                'backspace': keyboard.Key.backspace,
-                'shift': keyboard.Key.shift,
-                'shift_r': getattr(keyboard.Key, 'shift_r', keyboard.Key.shift),
-                'ctrl': keyboard.Key.ctrl,
-                'ctrl_r': getattr(keyboard.Key, 'ctrl_r', keyboard.Key.ctrl),
-                'alt': keyboard.Key.alt,
-                'alt_r': getattr(keyboard.Key, 'alt_r', keyboard.Key.alt),
-                'cmd': keyboard.Key.cmd,
-                'cmd_r': getattr(keyboard.Key, 'cmd_r', keyboard.Key.cmd),
-                'f1': keyboard.Key.f1, 'f2': keyboard.Key.f2, 'f3': keyboard.Key.f3, 'f4': keyboard.Key.f4,
-                'f5': keyboard.Key.f5, 'f6': keyboard.Key.f6, 'f7': keyboard.Key.f7, 'f8': keyboard.Key.f8,
-                'f9': keyboard.Key.f9, 'f10': keyboard.Key.f10, 'f11': keyboard.Key.f11, 'f12': keyboard.Key.f12,
-            }
-        return cls._SPECIAL_KEY_OBJECTS
-
     @staticmethod
     def key_to_name(key_event) -> str:
         """将 pynput 键盘事件对象转换为配置键名。"""
@@ -170,9 +186,9 @@ class KeyMapper:
         """
         将按键名称转换为 pynput 按键对象。
         """
-        special_keys = KeyMapper._get_special_key_objects()
-        if key_name in special_keys:
-            return special_keys[key_name]
+        special = _SPECIAL_KEY_OBJECTS.get(key_name)
+        if special is not None:
+            return special
 
         if len(key_name) == 1:
             return keyboard.KeyCode.from_char(key_name)
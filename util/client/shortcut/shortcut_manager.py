@@ -10,6 +10,7 @@
 from __future__ import annotations
 
 import platform
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
@@ -19,6 +20,7 @@ from pynput import keyboard, mouse
 from . import logger
 from util.client.shortcut.key_mapper import (
     KeyMapper,
+    get_keyboard_controller,
     KEYBOARD_MESSAGES,
     KEY_DOWN_MESSAGES,
     KEY_UP_MESSAGES,
@@ -36,6 +38,11 @@ if TYPE_CHECKING:
     from util.client.state import ClientState
 
 
+# 侧键对象在部分平台不存在，导入时解析一次，回调中免去 getattr
+_X1_BUTTON = getattr(mouse.Button, 'x1', None)
+_X2_BUTTON = getattr(mouse.Button, 'x2', None)
+
+
 class ShortcutManager:
     """快捷键管理器"""
 
@@ -59,9 +66,12 @@ class ShortcutManager:
         # 按键模拟器
         self._emulator = ShortcutEmulator()
 
-        # 按键恢复状态追踪
-        self._restoring_keys = set()
-        self._pressed_keys: Set[str] = set()
+        # 按键恢复状态追踪。
+        # 钩子线程写、其他线程读：存不可变 frozenset 并整体原子换绑，
+        # 读侧无锁拿引用即可做集合运算，写侧用小锁串行化重建。
+        self._keys_lock = threading.Lock()
+        self._restoring_keys: frozenset = frozenset()
+        self._pressed_keys: frozenset = frozenset()
         self._temporarily_blocked = False
 
         # 事件处理器
@@ -90,6 +100,44 @@ class ShortcutManager:
                     continue
             self.single_tasks[shortcut.key] = task
 
+        self._build_combo_match_sets()
+
+    def _build_combo_match_sets(self) -> None:
+        """
+        预计算组合键匹配集合，避免钩子回调中的嵌套生成器表达式。
+
+        - _combo_match_sets: 每个组合键各键位可接受的事件键名集合
+        - _combo_member_keys: 所有组合键成员键名的并集（快速排除无关按键）
+        - _suppress_keys: 需要阻塞的组合键成员键名集合
+        """
+        self._combo_match_sets: List[Tuple[Tuple[str, ...], Tuple[frozenset, ...], ShortcutTask]] = []
+        member_keys: Set[str] = set()
+        suppress_keys: Set[str] = set()
+
+        for combo_keys, combo_task in self.combo_tasks.items():
+            position_sets = tuple(
+                frozenset(self._key_alias_set(combo_key)) for combo_key in combo_keys
+            )
+            self._combo_match_sets.append((combo_keys, position_sets, combo_task))
+            for allowed in position_sets:
+                member_keys.update(allowed)
+                if combo_task.shortcut.suppress:
+                    suppress_keys.update(allowed)
+
+        self._combo_member_keys: frozenset = frozenset(member_keys)
+        self._suppress_keys: frozenset = frozenset(suppress_keys)
+
+    @staticmethod
+    def _key_alias_set(combo_key: str) -> Set[str]:
+        """组合键键位可匹配的事件键名集合（兼容左右修饰键）。"""
+        alias_map = {
+            'ctrl': {'ctrl', 'ctrl_r'},
+            'cmd': {'cmd', 'cmd_r'},
+            'alt': {'alt', 'alt_r'},
+            'shift': {'shift', 'shift_r'},
+        }
+        return alias_map.get(combo_key, {combo_key})
+
     @staticmethod
     def _split_combo_key(key: str) -> Tuple[str, ...]:
         """将组合键字符串拆分为按键元组，如 'ctrl+cmd' -> ('ctrl','cmd')。"""
@@ -100,18 +148,13 @@ class ShortcutManager:
         """判断事件键是否匹配组合键中的某个键位（兼容左右修饰键）。"""
         if combo_key == event_key:
             return True
-        alias_map = {
-            'ctrl': {'ctrl', 'ctrl_r'},
-            'cmd': {'cmd', 'cmd_r'},
-            'alt': {'alt', 'alt_r'},
-            'shift': {'shift', 'shift_r'},
-        }
-        return event_key in alias_map.get(combo_key, {combo_key})
+        return event_key in ShortcutManager._key_alias_set(combo_key)
 
-    def _is_combo_pressed(self, combo_keys: Tuple[str, ...]) -> bool:
-        """判断组合键是否全部按下（兼容左右修饰键）。"""
-        for combo_key in combo_keys:
-            if not any(self._is_key_matched(combo_key, k) for k in self._pressed_keys):
+    def _is_combo_pressed(self, position_sets: Tuple[frozenset, ...]) -> bool:
+        """判断组合键是否全部按下（基于预计算的键位集合）。"""
+        pressed = self._pressed_keys
+        for allowed in position_sets:
+            if not (allowed & pressed):
                 return False
         return True
 
@@ -139,7 +182,8 @@ class ShortcutManager:
         if self._should_ignore_key(key_name, is_release=False):
             return
 
-        self._pressed_keys.add(key_name)
+        with self._keys_lock:
+            self._pressed_keys = self._pressed_keys | {key_name}
 
         # 单键快捷键
         single_task = self.single_tasks.get(key_name)
@@ -147,10 +191,12 @@ class ShortcutManager:
             self._event_handler.handle_keydown(key_name, single_task)
 
         # 组合键快捷键：所有键都按下时触发
-        for combo_keys, combo_task in self.combo_tasks.items():
-            if not any(self._is_key_matched(combo_key, key_name) for combo_key in combo_keys):
+        if key_name not in self._combo_member_keys:
+            return
+        for combo_keys, position_sets, combo_task in self._combo_match_sets:
+            if not any(key_name in allowed for allowed in position_sets):
                 continue
-            if self._is_combo_pressed(combo_keys) and not combo_task.is_recording:
+            if self._is_combo_pressed(position_sets) and not combo_task.is_recording:
                 combo_name = '+'.join(combo_keys)
                 self._event_handler.handle_keydown(combo_name, combo_task)
 
@@ -160,22 +206,25 @@ class ShortcutManager:
         if not key_name:
             return
         if self._should_ignore_key(key_name, is_release=True):
-            self._pressed_keys.discard(key_name)
+            with self._keys_lock:
+                self._pressed_keys = self._pressed_keys - {key_name}
             return
 
         # 组合键：松开任一成员键即结束
-        for combo_keys, combo_task in self.combo_tasks.items():
-            in_combo = any(self._is_key_matched(combo_key, key_name) for combo_key in combo_keys)
-            if in_combo and combo_task.is_recording:
-                combo_name = '+'.join(combo_keys)
-                self._event_handler.handle_keyup(combo_name, combo_task)
+        if key_name in self._combo_member_keys:
+            for combo_keys, position_sets, combo_task in self._combo_match_sets:
+                in_combo = any(key_name in allowed for allowed in position_sets)
+                if in_combo and combo_task.is_recording:
+                    combo_name = '+'.join(combo_keys)
+                    self._event_handler.handle_keyup(combo_name, combo_task)
 
         # 单键快捷键
         single_task = self.single_tasks.get(key_name)
         if single_task:
             self._event_handler.handle_keyup(key_name, single_task)
 
-        self._pressed_keys.discard(key_name)
+        with self._keys_lock:
+            self._pressed_keys = self._pressed_keys - {key_name}
 
     def _handle_mouse_press(self, button_name: str) -> None:
         if self._temporarily_blocked:
@@ -202,6 +251,13 @@ class ShortcutManager:
 
     def create_keyboard_filter(self):
         """创建 Windows 键盘事件过滤器。"""
+        # 钩子每次按键都会回调，把热路径属性绑定到闭包局部变量，
+        # 将 LOAD_ATTR 换成 LOAD_FAST（监听器对象启动后才赋值，仍经 self 取）。
+        vk_to_name = KeyMapper.vk_to_name
+        single_tasks = self.single_tasks
+        suppress_keys = self._suppress_keys
+        handle_press = self._handle_keyboard_press
+        handle_release = self._handle_keyboard_release
 
         def win32_event_filter(msg, data):
             if msg not in KEYBOARD_MESSAGES:
@@ -209,20 +265,16 @@ class ShortcutManager:
             if self._temporarily_blocked:
                 return True
 
-            key_name = KeyMapper.vk_to_name(data.vkCode)
-            task = self.single_tasks.get(key_name)
+            key_name = vk_to_name(data.vkCode)
+            task = single_tasks.get(key_name)
 
             if msg in KEY_DOWN_MESSAGES:
-                self._handle_keyboard_press(key_name)
+                handle_press(key_name)
             elif msg in KEY_UP_MESSAGES:
-                self._handle_keyboard_release(key_name)
+                handle_release(key_name)
 
-            # 组合键的 suppress 暂按“成员键包含即阻塞”处理
-            combo_suppress = any(
-                any(self._is_key_matched(combo_key, key_name) for combo_key in combo_keys)
-                and combo_task.shortcut.suppress
-                for combo_keys, combo_task in self.combo_tasks.items()
-            )
+            # 组合键的 suppress 暂按“成员键包含即阻塞”处理（预计算集合，单次成员判断）
+            combo_suppress = key_name in suppress_keys
             if self.keyboard_listener and ((task and task.shortcut.suppress) or combo_suppress):
                 self.keyboard_listener.suppress_event()
 
@@ -232,6 +284,9 @@ class ShortcutManager:
 
     def create_mouse_filter(self):
         """创建 Windows 鼠标事件过滤器。"""
+        tasks = self.tasks
+        handle_press = self._handle_mouse_press
+        handle_release = self._handle_mouse_release
 
         def win32_event_filter(msg, data):
             if msg not in MOUSE_MESSAGES:
@@ -241,12 +296,12 @@ class ShortcutManager:
 
             xbutton = (data.mouseData >> 16) & 0xFFFF
             button_name = 'x1' if xbutton == XBUTTON1 else 'x2'
-            task = self.tasks.get(button_name)
+            task = tasks.get(button_name)
 
             if msg == WM_XBUTTONDOWN:
-                self._handle_mouse_press(button_name)
+                handle_press(button_name)
             elif msg == WM_XBUTTONUP:
-                self._handle_mouse_release(button_name)
+                handle_release(button_name)
 
             if task and task.shortcut.suppress and self.mouse_listener:
                 self.mouse_listener.suppress_event()
@@ -266,12 +321,9 @@ class ShortcutManager:
         self._handle_keyboard_release(key_name)
 
     def _on_mouse_click(self, _x, _y, button, pressed) -> None:
-        x1_button = getattr(mouse.Button, 'x1', None)
-        x2_button = getattr(mouse.Button, 'x2', None)
-
-        if x1_button is not None and button == x1_button:
+        if _X1_BUTTON is not None and button == _X1_BUTTON:
             button_name = 'x1'
-        elif x2_button is not None and button == x2_button:
+        elif _X2_BUTTON is not None and button == _X2_BUTTON:
             button_name = 'x2'
         else:
             return
@@ -312,12 +364,13 @@ class ShortcutManager:
         """
         安排按键恢复（延迟执行，避免在事件处理中阻塞）
         """
-        self._restoring_keys.add(key)
+        with self._keys_lock:
+            self._restoring_keys = self._restoring_keys | {key}
 
         def do_restore():
             time.sleep(0.05)
             if key == 'caps_lock':
-                controller = keyboard.Controller()
+                controller = get_keyboard_controller()
                 controller.press(keyboard.Key.caps_lock)
                 controller.release(keyboard.Key.caps_lock)
 
@@ -327,7 +380,8 @@ class ShortcutManager:
         return key in self._restoring_keys
 
     def clear_restoring_flag(self, key: str) -> None:
-        self._restoring_keys.discard(key)
+        with self._keys_lock:
+            self._restoring_keys = self._restoring_keys - {key}
 
     def _stop_all_active_tasks(self) -> None:
         """
@@ -339,7 +393,8 @@ class ShortcutManager:
                     task.cancel()
                 except Exception as e:
                     logger.debug(f"停止任务失败 [{task.shortcut.key}]: {e}")
-        self._pressed_keys.clear()
+        with self._keys_lock:
+            self._pressed_keys = frozenset()
 
     def set_temporarily_blocked(self, blocked: bool) -> bool:
         """
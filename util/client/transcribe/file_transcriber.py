@@ -159,10 +159,16 @@ class FileTranscriber:
         websocket = self.state.websocket
         
         try:
-            async for message in websocket:
-                message = json.loads(message)
-                console.print(f'    转录进度: {message["duration"]:.2f}s', end='\r')
-                if message['is_final']:
+            finished = False
+            async for frame in websocket:
+                parsed = json.loads(frame)
+                # 服务端可能把多条进度消息合并成一个数组帧一次下发
+                for message in parsed if isinstance(parsed, list) else [parsed]:
+                    console.print(f'    转录进度: {message["duration"]:.2f}s', end='\r')
+                    if message['is_final']:
+                        finished = True
+                        break
+                if finished:
                     break
         except websockets.exceptions.ConnectionClosed:
             console.print('\n[bold red]错误：在等待识别结果时，与服务端的连接已断开。[/bold red]')
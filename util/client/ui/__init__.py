@@ -3,114 +3,55 @@
 客户端 UI 门面模块
 
 该模块作为客户端访问 UI 功能的统一入口。
-通过延迟导入避免在无 Tk 环境下导入阶段失败。
+通过 PEP 562 的模块 __getattr__ 延迟导入：既避免在无 Tk 环境下导入阶段失败，
+也把 Tk 相关的冷启动工作移出主线程关键路径；首次访问后回填 globals()，
+之后的访问是普通属性命中，不再有逐次调用的 from-import 开销。
 """
 
 from __future__ import annotations
 
+import importlib
+
 from .. import logger
 import util.ui
 
 # 注入 Client Logger 到通用 UI 模块
 util.ui.set_ui_logger(logger)
 
-from util.client.ui.tips import TipsDisplay
-
-
-def toast(*args, **kwargs):
-    # 直接从子模块导入函数，避免被 util.ui.toast 同名模块对象覆盖。
-    from util.ui.toast import toast as _toast
-    return _toast(*args, **kwargs)
-
-
-def toast_stream(*args, **kwargs):
-    # 直接从子模块导入函数，避免被 util.ui.toast 同名模块对象覆盖。
-    from util.ui.toast import toast_stream as _toast_stream
-    return _toast_stream(*args, **kwargs)
-
-
-def enable_min_to_tray(*args, **kwargs):
-    from util.ui import enable_min_to_tray as _enable_min_to_tray
-    return _enable_min_to_tray(*args, **kwargs)
-
-
-def stop_tray(*args, **kwargs):
-    from util.ui import stop_tray as _stop_tray
-    return _stop_tray(*args, **kwargs)
-
-
-def on_add_rectify_record(*args, **kwargs):
-    from util.ui.rectify_menu_handler import on_add_rectify_record as _on_add_rectify_record
-    return _on_add_rectify_record(*args, **kwargs)
-
-
-def on_add_hotword(*args, **kwargs):
-    from util.ui.hotword_menu_handler import on_add_hotword as _on_add_hotword
-    return _on_add_hotword(*args, **kwargs)
-
-
-def on_edit_context(*args, **kwargs):
-    from util.ui.context_menu_handler import on_edit_context as _on_edit_context
-    return _on_edit_context(*args, **kwargs)
-
-
-def start_flow_bar(*args, **kwargs):
-    from util.client.ui.flow_bar import start_flow_bar as _start_flow_bar
-    return _start_flow_bar(*args, **kwargs)
-
-
-def stop_flow_bar(*args, **kwargs):
-    from util.client.ui.flow_bar import stop_flow_bar as _stop_flow_bar
-    return _stop_flow_bar(*args, **kwargs)
-
-
-def set_flow_state_resting(*args, **kwargs):
-    from util.client.ui.flow_bar import set_flow_state_resting as _set_flow_state_resting
-    return _set_flow_state_resting(*args, **kwargs)
-
-
-def set_flow_state_active_ptt(*args, **kwargs):
-    from util.client.ui.flow_bar import set_flow_state_active_ptt as _set_flow_state_active_ptt
-    return _set_flow_state_active_ptt(*args, **kwargs)
-
-
-def set_flow_state_processing(*args, **kwargs):
-    from util.client.ui.flow_bar import set_flow_state_processing as _set_flow_state_processing
-    return _set_flow_state_processing(*args, **kwargs)
-
-
-def set_flow_audio_level(*args, **kwargs):
-    from util.client.ui.flow_bar import set_flow_audio_level as _set_flow_audio_level
-    return _set_flow_audio_level(*args, **kwargs)
+# 名称 -> (模块路径, 属性名)。
+# toast/toast_stream 直接取子模块内函数，避免被 util.ui.toast 同名模块对象覆盖。
+_LAZY_ATTRS = {
+    'TipsDisplay': ('util.client.ui.tips', 'TipsDisplay'),
+    'toast': ('util.ui.toast', 'toast'),
+    'toast_stream': ('util.ui.toast', 'toast_stream'),
+    'ToastMessage': ('util.ui', 'ToastMessage'),
+    'ToastMessageManager': ('util.ui', 'ToastMessageManager'),
+    'enable_min_to_tray': ('util.ui', 'enable_min_to_tray'),
+    'stop_tray': ('util.ui', 'stop_tray'),
+    'on_add_rectify_record': ('util.ui.rectify_menu_handler', 'on_add_rectify_record'),
+    'on_add_hotword': ('util.ui.hotword_menu_handler', 'on_add_hotword'),
+    'on_edit_context': ('util.ui.context_menu_handler', 'on_edit_context'),
+    'start_flow_bar': ('util.client.ui.flow_bar', 'start_flow_bar'),
+    'stop_flow_bar': ('util.client.ui.flow_bar', 'stop_flow_bar'),
+    'set_flow_state_resting': ('util.client.ui.flow_bar', 'set_flow_state_resting'),
+    'set_flow_state_active_ptt': ('util.client.ui.flow_bar', 'set_flow_state_active_ptt'),
+    'set_flow_state_processing': ('util.client.ui.flow_bar', 'set_flow_state_processing'),
+    'set_flow_audio_level': ('util.client.ui.flow_bar', 'set_flow_audio_level'),
+}
 
 
 def __getattr__(name: str):
-    if name in ("ToastMessage", "ToastMessageManager"):
-        from util.ui import ToastMessage, ToastMessageManager
-        mapping = {
-            "ToastMessage": ToastMessage,
-            "ToastMessageManager": ToastMessageManager,
-        }
-        return mapping[name]
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    target = _LAZY_ATTRS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(target[0])
+    value = getattr(module, target[1])
+    # 回填模块 globals，后续访问不再进入 __getattr__
+    globals()[name] = value
+    return value
 
 
 __all__ = [
     'logger',
-    'TipsDisplay',
-    'toast',
-    'toast_stream',
-    'ToastMessage',
-    'ToastMessageManager',
-    'enable_min_to_tray',
-    'stop_tray',
-    'on_add_rectify_record',
-    'on_add_hotword',
-    'on_edit_context',
-    'start_flow_bar',
-    'stop_flow_bar',
-    'set_flow_state_resting',
-    'set_flow_state_active_ptt',
-    'set_flow_state_processing',
-    'set_flow_audio_level',
+    *_LAZY_ATTRS,
 ]
@@ -17,16 +17,23 @@ from __future__ import annotations
 import asyncio
 import math
 import platform
-import queue
 import subprocess
 import threading
-from dataclasses import dataclass
+import time
+from typing import NamedTuple
+
+import numpy as np
 
 from util.client import logger
 
+# 平台判断在渲染循环内高频出现，导入时定型
+_PLATFORM = platform.system()
+_IS_MAC = _PLATFORM == "Darwin"
+_IS_WIN = _PLATFORM == "Windows"
+
 
-@dataclass(frozen=True)
-class _FlowStyle:
+class _FlowStyle(NamedTuple):
+    """状态样式（NamedTuple：比 frozen dataclass 实例化更快，且同样不可变）。"""
     width: float
     height: float
 
@@ -66,13 +73,45 @@ _MACOS_DOCK_AUTOHIDE_INSET = 10
 _AUDIO_NOISE_FLOOR = 0.04
 _AUDIO_VISUAL_SMOOTH = 0.24
 
+# 帧间隔：active/processing 需要 30 Hz 驱动波形动画；
+# 静息态只剩短暂的尺寸/透明度插值，10 Hz 足够；
+# 静息且已稳定后画面完全静止，仅以 2 Hz 心跳泵 Tk 事件，
+# 新命令到达时经 wake 事件即时唤醒（事件驱动而非轮询）。
+_FRAME_INTERVAL_ACTIVE = 1 / 30
+_FRAME_INTERVAL_IDLE = 1 / 10
+_FRAME_INTERVAL_SETTLED = 0.5
+
+# 波形相位速度（相位/秒）：按真实时间推进而非按帧数累加，
+# 帧率切换或单帧卡顿（GC、update() 停顿）时波形不跳变、不变速。
+_PHASE_SPEED = 0.34 / _FRAME_INTERVAL_ACTIVE
+
 _BAR_COUNT = 10
 _BAR_ENVELOPE_SILENT = [0.08, 0.11, 0.14, 0.18, 0.23, 0.23, 0.18, 0.14, 0.11, 0.08]
 
+# 波形动画对 sin 精度要求很低，用 1024 档查表替代每帧十余次 math.sin 调用。
+_SIN_LUT_SIZE = 1024
+_SIN_LUT = [math.sin(i * 2.0 * math.pi / _SIN_LUT_SIZE) for i in range(_SIN_LUT_SIZE)]
+_SIN_LUT_SCALE = _SIN_LUT_SIZE / (2.0 * math.pi)
+
+# 柱条逐帧算式改为 NumPy 向量化：10 次标量迭代压缩成十余个长度 10 的向量操作
+_SIN_LUT_ARR = np.asarray(_SIN_LUT)
+_BAR_INDEX = np.arange(_BAR_COUNT, dtype=np.float64)
+_BAR_PHASE_OFFSETS = _BAR_INDEX * 0.62
+_BAR_SILENT_OFFSETS = _BAR_INDEX * 0.50
+_BAR_ENVELOPE_ARR = np.asarray(_BAR_ENVELOPE_SILENT)
+
+
+def _fast_sin_vec(x: "np.ndarray") -> "np.ndarray":
+    return _SIN_LUT_ARR[(x * _SIN_LUT_SCALE).astype(np.int64) & (_SIN_LUT_SIZE - 1)]
+
 
 class _FlowBarIndicator:
     def __init__(self) -> None:
-        self._commands: "queue.Queue[tuple[str, object]]" = queue.Queue()
+        # 单槽命令位：状态/音频都只关心最新值，引用赋值在 CPython 下原子，
+        # 免去 queue.Queue 的 Condition 与 deque 开销。
+        self._pending_state: str | None = None
+        self._pending_audio: float | None = None
+        self._stop_requested = False
         self._state = _STATE_RESTING
         self._audio_level = 0.0
         self._audio_visual_level = 0.0
@@ -86,24 +125,81 @@ class _FlowBarIndicator:
         self._current_alpha = _STATE_ALPHAS[_STATE_RESTING]
         self._target_alpha = _STATE_ALPHAS[_STATE_RESTING]
         self._ui_scale = 1.0
+        # 按缩放系数缓存的状态样式
+        self._scaled_styles: dict[str, _FlowStyle] = {}
+        self._scaled_styles_scale: float | None = None
         self._window_bg_color = _DEFAULT_BG_COLOR
         self._macos_transparent_bg_enabled = False
         self._frame_count = 0
         self._macos_dock_bottom_inset = 0
 
+        # 音频电平生产端节流状态
+        self._last_push_ts = 0.0
+        self._last_pushed_level = -1.0
+
+        # macOS Dock 偏移检测缓存
+        self._dock_inset_cached = 0
+        self._dock_inset_cached_at = 0.0
+        self._dock_domain_cache: dict | None = None
+
         self._running = False
         self._loop: asyncio.AbstractEventLoop | None = None
         self._task: asyncio.Task | None = None
+        # 非 macOS 下 UI 专用线程（持有独立事件循环与 Tk 对象）
+        self._thread: threading.Thread | None = None
+        # 命令到达时立即唤醒渲染循环，响应延迟不再受帧间隔下限约束
+        self._wake: asyncio.Event | None = None
 
         self._tk = None
         self._host = None
         self._root = None
         self._canvas = None
 
+        # 复用的 canvas item：启动时创建一次，之后每帧只改坐标/属性
+        self._pill_id: int | None = None
+        self._bar_ids: list[int] = []
+        self._last_fill: str | None = None
+        self._bars_hidden = True
+        self._canvas_path = ""
+
+        # Pillow 可用时胶囊背景用预渲染图片（抗锯齿、零逐帧描画成本），
+        # 按 (宽, 高, 填充色) 桶缓存；不可用时回退圆头线段。
+        self._pill_uses_image = False
+        self._pill_image_id: int | None = None
+        self._pill_image_key: tuple[int, int, str] | None = None
+        self._pill_cache: dict[tuple[int, int, str], object] = {}
+        self._last_pill_geom: tuple[float, float] | None = None
+
+        # 柱条几何缓存（仅依赖宽高）
+        self._geom_cache_key: tuple[float | None, float | None] = (None, None)
+        self._geom_cache: tuple[float, float, float] | None = None
+
+        # 上次真正下发给 Tk 的透明度与窗口几何
+        self._last_alpha_set: float | None = None
+        self._last_geometry: tuple[int, int, int, int] | None = None
+
+        # 可用屏幕区域缓存：逐帧 winfo_*/Win32 查询是纯开销，
+        # 屏幕布局变化经 <Configure> 事件或周期性 UI 缩放刷新时失效
+        self._usable_rect_cache: tuple[int, int, int, int] | None = None
+        self._screen_size_cache: tuple[int, int] | None = None
+
     def start(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
         if self._running:
             return
 
+        # 非 macOS：Tk 创建与 30Hz 渲染整体搬到专用线程 + 独立事件循环，
+        # 录音/WebSocket 所在的主事件循环不再为每帧 update() 买单；
+        # Tk 对象线程绑定，窗口必须在该线程内创建与使用。
+        # macOS 的 Tk 只能跑在主线程，保留原地路径。
+        if not _IS_MAC:
+            self._running = True
+            thread = threading.Thread(
+                target=self._thread_main, name="flow-bar-ui", daemon=True
+            )
+            self._thread = thread
+            thread.start()
+            return
+
         if loop is None:
             try:
                 loop = asyncio.get_running_loop()
@@ -112,15 +208,39 @@ class _FlowBarIndicator:
                 return
 
         # macOS 必须在主线程创建窗口
-        if platform.system() == "Darwin" and threading.current_thread() is not threading.main_thread():
+        if threading.current_thread() is not threading.main_thread():
             logger.warning("Flow Bar 启动失败：macOS 需要在主线程创建窗口")
             return
 
+        self._loop = loop
+        if not self._create_window():
+            return
+        self._running = True
+        self._task = loop.create_task(self._run_loop())
+
+    def _thread_main(self) -> None:
+        """UI 专用线程入口：独立事件循环驱动渲染，退出时回收循环。"""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        try:
+            if not self._create_window():
+                self._running = False
+                return
+            loop.run_until_complete(self._run_loop())
+        finally:
+            try:
+                loop.close()
+            except Exception:
+                pass
+
+    def _create_window(self) -> bool:
+        """在当前线程创建窗口与复用 canvas item，失败返回 False。"""
         try:
             import tkinter as tk
         except Exception as exc:
             logger.warning(f"Flow Bar 初始化失败（Tk 不可用）: {exc}")
-            return
+            return False
 
         try:
             # 使用隐藏 host + 顶层 bar。host 被强制隐藏到屏幕外，避免出现额外标题栏窗口。
@@ -164,9 +284,9 @@ class _FlowBarIndicator:
             except Exception:
                 pass
 
-            self._window_bg_color = _WINDOWS_TRANSPARENT_KEY if platform.system() == "Windows" else _DEFAULT_BG_COLOR
+            self._window_bg_color = _WINDOWS_TRANSPARENT_KEY if _IS_WIN else _DEFAULT_BG_COLOR
 
-            if platform.system() == "Darwin":
+            if _IS_MAC:
                 # macOS: 强制无标题栏样式，隐藏红黄绿按钮
                 try:
                     root.tk.call("::tk::unsupported::MacWindowStyle", "style", root._w, "floating", "none")
@@ -177,14 +297,14 @@ class _FlowBarIndicator:
                 except Exception:
                     pass
 
-            if platform.system() == "Darwin":
+            if _IS_MAC:
                 bg = _MACOS_TRANSPARENT_BG
             else:
                 bg = self._window_bg_color
             root.configure(bg=bg)
             canvas = tk.Canvas(root, highlightthickness=0, bd=0, bg=bg)
             canvas.pack(fill=tk.BOTH, expand=True)
-            if platform.system() == "Darwin":
+            if _IS_MAC:
                 try:
                     root.wm_attributes("-transparent", True)
                     self._macos_transparent_bg_enabled = True
@@ -192,7 +312,7 @@ class _FlowBarIndicator:
                     self._macos_transparent_bg_enabled = False
                     root.configure(bg=_DEFAULT_BG_COLOR)
                     canvas.configure(bg=_DEFAULT_BG_COLOR)
-            if platform.system() == "Windows":
+            if _IS_WIN:
                 try:
                     # 仅显示胶囊形主体，隐藏矩形窗口底板
                     root.wm_attributes("-transparentcolor", bg)
@@ -201,9 +321,37 @@ class _FlowBarIndicator:
                     root.configure(bg=self._window_bg_color)
                     canvas.configure(bg=self._window_bg_color)
 
+            # 预创建 canvas item：每帧 delete("all") + create_* 的 Tcl 往返开销
+            # 远高于 coords 更新，改为一次创建、之后复用。
+            try:
+                from PIL import Image, ImageDraw, ImageTk  # noqa: F401
+                self._pill_uses_image = True
+            except Exception:
+                self._pill_uses_image = False
+
+            if self._pill_uses_image:
+                self._pill_image_id = canvas.create_image(0, 0, anchor="nw")
+            else:
+                self._pill_id = canvas.create_line(0, 0, 0, 0, capstyle="round")
+            self._bar_ids = [
+                canvas.create_rectangle(0, 0, 0, 0, fill="#f2f6ff", outline="", state="hidden")
+                for _ in range(_BAR_COUNT)
+            ]
+            self._last_fill = None
+            self._bars_hidden = True
+            # 缓存 canvas 的 Tcl 路径，用于单脚本批量下发 coords
+            self._canvas_path = str(canvas)
+
             self._refresh_ui_scale(reset_current=True)
-            if platform.system() == "Darwin":
-                self._macos_dock_bottom_inset = self._detect_macos_dock_bottom_inset()
+            if _IS_MAC:
+                # Dock 探测可能 spawn 子进程，放到线程池并稍作延迟，
+                # 不阻塞窗口创建与首帧
+                loop = self._loop
+                if loop is not None:
+                    loop.call_later(
+                        0.1,
+                        lambda: loop.run_in_executor(None, self._refresh_dock_inset_blocking),
+                    )
             try:
                 root.deiconify()
             except Exception:
@@ -213,30 +361,46 @@ class _FlowBarIndicator:
             self._host = host
             self._root = root
             self._canvas = canvas
-            self._loop = loop
-            self._running = True
 
-            self._task = loop.create_task(self._run_loop())
+            # 无边框样式不必每帧强制，仅启动时与窗口重映射/重配置时补一次；
+            # 窗口事件同时使屏幕可用区域缓存失效
+            self._enforce_borderless()
+            try:
+                root.bind("<Map>", self._on_window_event)
+                root.bind("<Configure>", self._on_window_event)
+            except Exception:
+                pass
+            return True
         except Exception as exc:
             logger.warning(f"Flow Bar 初始化失败（窗口创建异常）: {exc}")
-            self._running = False
             self._tk = None
             self._host = None
             self._root = None
             self._canvas = None
+            return False
 
     def stop(self) -> None:
         if not self._running:
             return
-        self._commands.put(("stop", None))
+        self._stop_requested = True
         # 确保尽快唤醒主循环处理 stop
-        if self._loop and self._loop.is_running():
-            self._loop.call_soon_threadsafe(lambda: None)
+        self._notify()
+
+    def _notify(self) -> None:
+        """从任意线程唤醒渲染循环。"""
+        loop = self._loop
+        wake = self._wake
+        if loop and wake and loop.is_running():
+            try:
+                loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:
+                pass
 
     def set_state(self, state: str) -> None:
         if state not in _STYLES:
             return
-        self._commands.put(("state", state))
+        self._pending_state = state
+        self._notify()
 
     def set_audio_level(self, level: float) -> None:
         value = float(level)
@@ -244,9 +408,37 @@ class _FlowBarIndicator:
             value = 0.0
         if value > 1:
             value = 1.0
-        self._commands.put(("audio", value))
+        # 音频线程按块回调，频率远高于帧率。生产端节流：
+        # 量化到 32 级（柱高上视觉无差别），量化值未变且 30ms 内不重复入队。
+        quantized = round(value * 32) / 32
+        now = time.monotonic()
+        if quantized == self._last_pushed_level and now - self._last_push_ts <= 0.030:
+            return
+        self._last_pushed_level = quantized
+        self._last_push_ts = now
+        self._pending_audio = quantized
+        self._notify()
+
+    async def _sleep_interruptible(self, interval: float) -> None:
+        """睡到下一帧，但命令到达时立即被唤醒。"""
+        wake = self._wake
+        if wake is None:
+            await asyncio.sleep(interval)
+            return
+        try:
+            await asyncio.wait_for(wake.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+        wake.clear()
 
     async def _run_loop(self) -> None:
+        self._wake = asyncio.Event()
+        # 闭环帧间隔控制：按绝对截止时刻睡眠而非固定 sleep(1/30)，
+        # 帧周期不再是“绘制耗时 + 33ms”
+        next_deadline = 0.0
+        last_interval: float | None = None
+        # 相位基准时刻：monotonic 时钟保证不受系统时间调整影响
+        phase_origin = time.monotonic()
         try:
             while self._running and self._root and self._canvas:
                 if self._process_commands():
@@ -256,63 +448,112 @@ class _FlowBarIndicator:
                 self._current_height += (self._target_height - self._current_height) * 0.28
                 self._current_alpha += (self._target_alpha - self._current_alpha) * 0.28
                 self._audio_visual_level += (self._audio_level - self._audio_visual_level) * _AUDIO_VISUAL_SMOOTH
-                self._phase += 0.34
+
+                # 几何衰减插值永远到不了目标值，接近时直接吸附，
+                # 让静息态能真正进入“已稳定”而不是无限亚像素逼近。
+                if abs(self._target_width - self._current_width) < 0.5:
+                    self._current_width = self._target_width
+                if abs(self._target_height - self._current_height) < 0.5:
+                    self._current_height = self._target_height
+                if abs(self._target_alpha - self._current_alpha) < 0.005:
+                    self._current_alpha = self._target_alpha
+
                 self._frame_count += 1
                 if self._frame_count % 60 == 0:
                     self._refresh_ui_scale(reset_current=False)
-                if platform.system() == "Darwin" and self._frame_count % 180 == 0:
-                    self._macos_dock_bottom_inset = self._detect_macos_dock_bottom_inset()
+                if _IS_MAC and self._frame_count % 1800 == 0:
+                    # 放线程池执行，渲染循环不被 defaults read 子进程卡住
+                    self._loop.run_in_executor(None, self._refresh_dock_inset_blocking)
+
+                settled = (
+                    self._current_width == self._target_width
+                    and self._current_height == self._target_height
+                    and self._current_alpha == self._target_alpha
+                )
+
+                # 静息稳定态：画面完全静止，跳过绘制与几何提交，降频轮询命令。
+                if settled and self._state == _STATE_RESTING and self._audio_level == 0.0:
+                    self._root.update()
+                    last_interval = None
+                    await self._sleep_interruptible(_FRAME_INTERVAL_SETTLED)
+                    continue
+
+                # 相位由真实时间确定性导出：等价于稳定 30Hz 下的每帧 +0.34
+                self._phase = (time.monotonic() - phase_origin) * _PHASE_SPEED
 
-                self._enforce_borderless()
                 self._apply_geometry()
                 self._set_window_alpha(self._current_alpha)
                 self._draw_pill()
 
-                self._root.update_idletasks()
+                # update() 本身会先执行 idle 回调，再多调一次 update_idletasks 是重复遍历
                 self._root.update()
-                await asyncio.sleep(0.033)
+                interval = (
+                    _FRAME_INTERVAL_ACTIVE
+                    if self._state != _STATE_RESTING or not settled
+                    else _FRAME_INTERVAL_IDLE
+                )
+                if interval != last_interval:
+                    last_interval = interval
+                    next_deadline = time.monotonic()
+                next_deadline += interval
+                delay = next_deadline - time.monotonic()
+                if delay < -interval:
+                    # 单帧落后过多（GC/卡顿）：跳帧并重置基准，避免积压追赶
+                    next_deadline = time.monotonic() + interval
+                    delay = interval
+                if delay > 0:
+                    await self._sleep_interruptible(delay)
         except Exception as exc:
             logger.warning(f"Flow Bar 运行异常，已自动禁用: {exc}")
         finally:
             self._destroy_window()
             self._running = False
             self._task = None
+            self._thread = None
 
     def _process_commands(self) -> bool:
-        while True:
-            try:
-                cmd, payload = self._commands.get_nowait()
-            except queue.Empty:
-                break
-
-            if cmd == "stop":
-                return True
-
-            if cmd == "state":
-                self._state = str(payload)
-                style = self._style_for_state(self._state)
-                self._target_width = style.width
-                self._target_height = style.height
-                self._target_alpha = _STATE_ALPHAS.get(self._state, _STATE_ALPHAS[_STATE_RESTING])
-                if self._state == _STATE_RESTING:
-                    self._audio_level = 0.0
-                    self._audio_visual_level = 0.0
-            elif cmd == "audio":
-                self._audio_level = float(payload)
+        # 读取并清空单槽命令位；生产端高频写入时自然只保留最新值。
+        if self._stop_requested:
+            return True
+
+        state = self._pending_state
+        if state is not None:
+            self._pending_state = None
+            self._state = str(state)
+            style = self._style_for_state(self._state)
+            self._target_width = style.width
+            self._target_height = style.height
+            self._target_alpha = _STATE_ALPHAS.get(self._state, _STATE_ALPHAS[_STATE_RESTING])
+            if self._state == _STATE_RESTING:
+                self._pending_audio = None
+                self._audio_level = 0.0
+                self._audio_visual_level = 0.0
+
+        audio = self._pending_audio
+        if audio is not None:
+            self._pending_audio = None
+            self._audio_level = float(audio)
 
         return False
 
     def _style_for_state(self, state: str) -> _FlowStyle:
-        base = _STYLES.get(state, _STYLES[_STATE_RESTING])
+        # 缩放系数不变时三种状态的样式都是常量，整组缓存，
+        # 状态切换热路径上不再新建 _FlowStyle
         scale = max(_MIN_UI_SCALE, min(_MAX_UI_SCALE, float(self._ui_scale)))
-        return _FlowStyle(
-            width=base.width * scale,
-            height=base.height * scale,
-        )
+        if scale != self._scaled_styles_scale:
+            self._scaled_styles = {
+                key: _FlowStyle(width=base.width * scale, height=base.height * scale)
+                for key, base in _STYLES.items()
+            }
+            self._scaled_styles_scale = scale
+        return self._scaled_styles.get(state, self._scaled_styles[_STATE_RESTING])
 
     def _refresh_ui_scale(self, reset_current: bool = False) -> None:
         if not self._root:
             return
+        # 周期性刷新时顺带失效屏幕区域缓存，兜底无 <Configure> 事件的分辨率变化
+        self._usable_rect_cache = None
+        self._screen_size_cache = None
         self._ui_scale = self._detect_ui_scale()
         style = self._style_for_state(self._state)
         self._target_width = style.width
@@ -326,8 +567,9 @@ class _FlowBarIndicator:
             return 1.0
 
         try:
-            screen_w = float(self._root.winfo_screenwidth())
-            screen_h = float(self._root.winfo_screenheight())
+            size = self._get_screen_size()
+            screen_w = float(size[0])
+            screen_h = float(size[1])
         except Exception:
             screen_w = _BASE_SCREEN_WIDTH
             screen_h = _BASE_SCREEN_HEIGHT
@@ -360,22 +602,42 @@ class _FlowBarIndicator:
         y = int(bottom - bottom_padding - height - platform_bottom_inset)
         if y < top + edge_padding:
             y = top + edge_padding
+        # 取整后几何未变就不再下发 geometry 命令（亚像素插值期间常见）
+        geometry = (width, height, x, y)
+        if geometry == self._last_geometry:
+            return
         self._root.geometry(f"{width}x{height}+{x}+{y}")
+        self._last_geometry = geometry
 
     def _get_platform_bottom_inset(self, usable_bottom: int) -> int:
-        if platform.system() != "Darwin" or not self._root:
+        if not _IS_MAC or not self._root:
             return 0
 
         # 若工作区已排除 Dock（usable_bottom < screen_h），不再重复抬高。
         try:
-            screen_h = int(self._root.winfo_screenheight())
+            screen_h = self._get_screen_size()[1]
         except Exception:
             screen_h = usable_bottom
         if usable_bottom < screen_h - 2:
             return 0
         return max(0, int(self._macos_dock_bottom_inset))
 
+    def _read_macos_dock_domain(self) -> dict | None:
+        """优先经 PyObjC 读取 Dock 配置域，免去逐项 spawn `defaults read` 子进程。"""
+        try:
+            from Foundation import NSUserDefaults
+
+            domain = NSUserDefaults.standardUserDefaults().persistentDomainForName_("com.apple.dock")
+            if domain is None:
+                return {}
+            return dict(domain)
+        except Exception:
+            return None
+
     def _read_macos_dock_pref(self, key: str) -> str:
+        if self._dock_domain_cache is not None:
+            value = self._dock_domain_cache.get(key)
+            return "" if value is None else str(value).strip()
         try:
             result = subprocess.run(
                 ["defaults", "read", "com.apple.dock", key],
@@ -390,10 +652,31 @@ class _FlowBarIndicator:
         except Exception:
             return ""
 
+    def _refresh_dock_inset_blocking(self) -> None:
+        """在工作线程中探测 Dock 偏移并回写（引用赋值原子，无需回到事件循环）。"""
+        try:
+            self._macos_dock_bottom_inset = self._detect_macos_dock_bottom_inset()
+        except Exception:
+            pass
+
     def _detect_macos_dock_bottom_inset(self) -> int:
-        if platform.system() != "Darwin":
+        if not _IS_MAC:
             return 0
 
+        # Dock 配置只在用户改系统设置时才会变化，60 秒内直接复用缓存，
+        # 避免渲染循环周期性 spawn 子进程。
+        now = time.monotonic()
+        if self._dock_inset_cached_at > 0 and now - self._dock_inset_cached_at < 60.0:
+            return self._dock_inset_cached
+
+        inset = self._detect_macos_dock_bottom_inset_uncached()
+        self._dock_inset_cached = inset
+        self._dock_inset_cached_at = now
+        return inset
+
+    def _detect_macos_dock_bottom_inset_uncached(self) -> int:
+        self._dock_domain_cache = self._read_macos_dock_domain()
+
         orientation = self._read_macos_dock_pref("orientation").lower()
         if orientation and orientation != "bottom":
             return 0
@@ -422,15 +705,31 @@ class _FlowBarIndicator:
         max_inset = int(_MACOS_DOCK_MAX_INSET * self._ui_scale)
         return max(min_inset, min(estimated, max_inset))
 
+    def _on_window_event(self, _event=None) -> None:
+        self._usable_rect_cache = None
+        self._screen_size_cache = None
+        self._enforce_borderless()
+
+    def _get_screen_size(self) -> tuple[int, int]:
+        """屏幕整体尺寸（winfo 查询带缓存）。"""
+        if self._screen_size_cache is None:
+            self._screen_size_cache = (
+                int(self._root.winfo_screenwidth()),
+                int(self._root.winfo_screenheight()),
+            )
+        return self._screen_size_cache
+
     def _get_usable_screen_rect(self) -> tuple[int, int, int, int]:
         if not self._root:
             return (0, 0, 1920, 1080)
 
+        if self._usable_rect_cache is not None:
+            return self._usable_rect_cache
+
         # 默认使用整屏尺寸
         left = 0
         top = 0
-        right = int(self._root.winfo_screenwidth())
-        bottom = int(self._root.winfo_screenheight())
+        right, bottom = self._get_screen_size()
 
         # 优先尝试 Tk 的虚拟根工作区（部分平台会排除任务栏/Dock）
         try:
@@ -447,7 +746,7 @@ class _FlowBarIndicator:
             pass
 
         # Windows 使用系统工作区，精确避开任务栏（含置顶/高任务栏）
-        if platform.system() == "Windows":
+        if _IS_WIN:
             try:
                 import ctypes
 
@@ -472,7 +771,8 @@ class _FlowBarIndicator:
             except Exception:
                 pass
 
-        return left, top, right, bottom
+        self._usable_rect_cache = (left, top, right, bottom)
+        return self._usable_rect_cache
 
     def _enforce_borderless(self) -> None:
         if not self._root:
@@ -485,7 +785,7 @@ class _FlowBarIndicator:
             self._root.wm_overrideredirect(True)
         except Exception:
             pass
-        if platform.system() == "Darwin":
+        if _IS_MAC:
             try:
                 self._root.tk.call("::tk::unsupported::MacWindowStyle", "style", self._root._w, "floating", "none")
             except Exception:
@@ -499,15 +799,48 @@ class _FlowBarIndicator:
         if not self._root:
             return
         clamped = max(0.20, min(1.0, float(value)))
+        # 透明度收敛后每帧重复下发同值是纯 Tcl 往返浪费
+        if self._last_alpha_set is not None and abs(clamped - self._last_alpha_set) <= 0.01:
+            return
         try:
             self._root.attributes("-alpha", clamped)
+            self._last_alpha_set = clamped
         except Exception:
             pass
 
+    def _render_pill_image(self, width: int, height: int, fill: str):
+        """预渲染一张抗锯齿胶囊图（4x 超采样后缩回）。"""
+        from PIL import Image, ImageDraw, ImageTk
+
+        ss = 4
+        image = Image.new("RGBA", (width * ss, height * ss), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        draw.rounded_rectangle(
+            (0, 0, width * ss - 1, height * ss - 1),
+            radius=(height * ss) // 2,
+            fill=fill,
+        )
+        image = image.resize((width, height), Image.LANCZOS)
+        return ImageTk.PhotoImage(image, master=self._canvas)
+
+    def _update_pill_image(self, w: float, h: float, fill: str) -> None:
+        key = (max(16, int(round(w))), max(8, int(round(h))), fill)
+        if key == self._pill_image_key:
+            return
+        image = self._pill_cache.get(key)
+        if image is None:
+            # 桶数量有限（三种状态间插值），但仍设上限防配置异常时无界增长
+            if len(self._pill_cache) > 128:
+                self._pill_cache.clear()
+            image = self._render_pill_image(*key)
+            self._pill_cache[key] = image
+        self._canvas.itemconfigure(self._pill_image_id, image=image)
+        self._pill_image_key = key
+
     def _draw_pill(self) -> None:
-        if not self._canvas:
+        canvas = self._canvas
+        if not canvas or (self._pill_id is None and self._pill_image_id is None):
             return
-        self._canvas.delete("all")
         w = max(16.0, self._current_width)
         h = max(8.0, self._current_height)
         r = h / 2.0
@@ -518,21 +851,52 @@ class _FlowBarIndicator:
         elif self._state == _STATE_PROCESSING:
             fill = "#1a1f25"
 
-        # 用圆头线段绘制胶囊背景，边缘更圆滑。
         cy = h / 2.0
-        x1 = max(r, 0.0)
-        x2 = max(x1, w - r)
-        self._canvas.create_line(x1, cy, x2, cy, fill=fill, width=h, capstyle="round")
+        if self._pill_uses_image:
+            # 预渲染胶囊图：仅在 (w, h, fill) 桶变化时切换图片
+            self._update_pill_image(w, h, fill)
+        else:
+            # 回退：用圆头线段绘制胶囊背景；复用 item，仅更新坐标与属性。
+            # 胶囊主体是静态层：几何与填充色都没变时一条 Tcl 命令也不发，
+            # 每帧真正要动的只有柱条（blitting 式静态/动态分层）。
+            if (w, h) != self._last_pill_geom:
+                x1 = max(r, 0.0)
+                x2 = max(x1, w - r)
+                canvas.coords(self._pill_id, x1, cy, x2, cy)
+                canvas.itemconfigure(self._pill_id, width=h)
+                self._last_pill_geom = (w, h)
+            if fill != self._last_fill:
+                canvas.itemconfigure(self._pill_id, fill=fill)
+                self._last_fill = fill
+
+        # 热路径内的 Tk 方法与高频属性绑定为局部变量（LOAD_ATTR -> LOAD_FAST）
+        itemconfigure = canvas.itemconfigure
 
         if self._state == _STATE_RESTING:
+            if not self._bars_hidden:
+                for bar_id in self._bar_ids:
+                    itemconfigure(bar_id, state="hidden")
+                self._bars_hidden = True
             return
 
+        if self._bars_hidden:
+            for bar_id in self._bar_ids:
+                itemconfigure(bar_id, state="normal")
+            self._bars_hidden = False
+
         bars = _BAR_COUNT
-        base_bar_w = max(2.0, (w * 0.42) / bars)
-        bar_w = max(1.2, base_bar_w * 0.8)
-        gap = base_bar_w * 0.55
-        total = bars * bar_w + (bars - 1) * gap
-        start_x = (w - total) / 2.0
+        # 柱条横向几何只依赖 (w, h)，按半像素量化做缓存，稳定帧免重算
+        geom_key = (round(w * 2) / 2, round(h * 2) / 2)
+        if geom_key != self._geom_cache_key:
+            base_bar_w = max(2.0, (w * 0.42) / bars)
+            bar_w = max(1.2, base_bar_w * 0.8)
+            gap = base_bar_w * 0.55
+            total = bars * bar_w + (bars - 1) * gap
+            start_x = (w - total) / 2.0
+            self._geom_cache_key = geom_key
+            self._geom_cache = (bar_w, gap, start_x)
+        else:
+            bar_w, gap, start_x = self._geom_cache
         cy = h / 2.0
 
         audio_activity_raw = max(
@@ -542,41 +906,59 @@ class _FlowBarIndicator:
         # 提升低电平区段灵敏度，让轻声输入更容易进入“有声”波动
         audio_activity = audio_activity_raw ** 0.62
 
-        for i in range(bars):
-            px = self._phase + i * 0.62
-            wave = abs(math.sin(px))
-            if self._state == _STATE_ACTIVE_PTT:
-                # 无声录音态：中心更高，仅轻微律动。
-                silent_wave = 0.02 * abs(math.sin(self._phase * 0.68 + i * 0.50))
-                silent_scale = _BAR_ENVELOPE_SILENT[i] + silent_wave
-
-                # 有声录音态：保持原有显著波幅，并用音量放大。
-                audio_amp = 0.36 + 0.82 * self._audio_visual_level
-                audio_scale = 0.28 + audio_amp * wave
-
-                # 根据音频活动度在 silent/audio 两种样式间平滑过渡。
-                scale = silent_scale * (1.0 - audio_activity) + audio_scale * audio_activity
-            else:
-                scale = 0.35 + 0.55 * wave
-
-            scale = max(0.0, min(1.0, scale))
-            if self._state == _STATE_ACTIVE_PTT:
-                # 无音时接近“....”小点；检测到语音后逐步恢复到长柱波动。
-                silent_min_bar_h = max(1.0, h * 0.05)
-                silent_max_bar_h = max(2.0, h * 0.24)
-                audio_min_bar_h = max(2.0, h * 0.16)
-                audio_max_bar_h = h * 0.62
-                min_bar_h = silent_min_bar_h * (1.0 - audio_activity) + audio_min_bar_h * audio_activity
-                max_bar_h = silent_max_bar_h * (1.0 - audio_activity) + audio_max_bar_h * audio_activity
-            else:
-                max_bar_h = h * 0.62
-                min_bar_h = max(2.0, h * 0.16)
-            bar_h = min_bar_h + (max_bar_h - min_bar_h) * scale
-            x1 = start_x + i * (bar_w + gap)
-            x2 = x1 + bar_w
-            y1 = cy - bar_h / 2.0
-            y2 = cy + bar_h / 2.0
-            self._canvas.create_rectangle(x1, y1, x2, y2, fill="#f2f6ff", outline="")
+        # 柱高上下限与有声波幅都与柱序号无关，提到循环外
+        is_active = self._state == _STATE_ACTIVE_PTT
+        if is_active:
+            # 无音时接近“....”小点；检测到语音后逐步恢复到长柱波动。
+            silent_min_bar_h = max(1.0, h * 0.05)
+            silent_max_bar_h = max(2.0, h * 0.24)
+            audio_min_bar_h = max(2.0, h * 0.16)
+            audio_max_bar_h = h * 0.62
+            min_bar_h = silent_min_bar_h * (1.0 - audio_activity) + audio_min_bar_h * audio_activity
+            max_bar_h = silent_max_bar_h * (1.0 - audio_activity) + audio_max_bar_h * audio_activity
+            audio_amp = 0.36 + 0.82 * self._audio_visual_level
+        else:
+            max_bar_h = h * 0.62
+            min_bar_h = max(2.0, h * 0.16)
+            audio_amp = 0.0
+        bar_h_range = max_bar_h - min_bar_h
+        step = bar_w + gap
+
+        phase = self._phase
+        wave = np.abs(_fast_sin_vec(phase + _BAR_PHASE_OFFSETS))
+        if is_active:
+            # 无声录音态：中心更高，仅轻微律动。
+            silent_wave = 0.02 * np.abs(_fast_sin_vec(phase * 0.68 + _BAR_SILENT_OFFSETS))
+            silent_scale = _BAR_ENVELOPE_ARR + silent_wave
+
+            # 有声录音态：保持原有显著波幅，并用音量放大；
+            # 根据音频活动度在 silent/audio 两种样式间平滑过渡。
+            audio_scale = 0.28 + audio_amp * wave
+            scale = silent_scale * (1.0 - audio_activity) + audio_scale * audio_activity
+        else:
+            scale = 0.35 + 0.55 * wave
+
+        half_bar_h = (min_bar_h + bar_h_range * np.clip(scale, 0.0, 1.0)) / 2.0
+        xs1 = start_x + _BAR_INDEX * step
+        xs2 = xs1 + bar_w
+        ys1 = cy - half_bar_h
+        ys2 = cy + half_bar_h
+
+        # 10 条 coords 合并为一段 Tcl 脚本、一次解释器分发，
+        # 省去逐条 Python→Tcl 往返
+        bar_ids = self._bar_ids
+        canvas_path = self._canvas_path
+        try:
+            script = "; ".join(
+                f"{canvas_path} coords {bar_ids[i]} "
+                f"{xs1[i]:.2f} {ys1[i]:.2f} {xs2[i]:.2f} {ys2[i]:.2f}"
+                for i in range(bars)
+            )
+            self._root.tk.eval(script)
+        except Exception:
+            coords = canvas.coords
+            for i in range(bars):
+                coords(bar_ids[i], xs1[i], ys1[i], xs2[i], ys2[i])
 
     def _destroy_window(self) -> None:
         if self._root:
@@ -593,6 +975,14 @@ class _FlowBarIndicator:
         self._root = None
         self._canvas = None
         self._tk = None
+        self._pill_id = None
+        self._bar_ids = []
+        self._last_fill = None
+        self._bars_hidden = True
+        self._pill_image_id = None
+        self._pill_image_key = None
+        self._pill_cache = {}
+        self._last_pill_geom = None
 
 
 _FLOW_BAR: _FlowBarIndicator | None = None
@@ -32,6 +32,7 @@ class FunASREngine:
         metal_enable: bool = True,
         onnx_padding_mode: str = "auto",
         onnx_padding_secs: int = 30,
+        onnx_graph_opt_level: int = 2,
         vulkan_enable: bool = True,
         vulkan_force_fp32: bool = False,
     ):
@@ -52,6 +53,7 @@ class FunASREngine:
             metal_enable=metal_enable,
             onnx_padding_mode=onnx_padding_mode,
             onnx_padding_secs=onnx_padding_secs,
+            onnx_graph_opt_level=onnx_graph_opt_level,
             vulkan_enable=vulkan_enable,
             vulkan_force_fp32=vulkan_force_fp32
         )
@@ -139,6 +141,7 @@ def create_asr_engine(
     metal_enable: bool = True,
     onnx_padding_mode: str = "auto",
     onnx_padding_secs: int = 30,
+    onnx_graph_opt_level: int = 2,
     vulkan_enable: bool = True,
     vulkan_force_fp32: bool = False,
     verbose: bool = True,
@@ -160,6 +163,7 @@ def create_asr_engine(
         metal_enable=metal_enable,
         onnx_padding_mode=onnx_padding_mode,
         onnx_padding_secs=onnx_padding_secs,
+        onnx_graph_opt_level=onnx_graph_opt_level,
         vulkan_enable=vulkan_enable,
         vulkan_force_fp32=vulkan_force_fp32,
     )
@@ -98,6 +98,7 @@ class ModelManager:
             coreml_enable=self.config.coreml_enable,
             padding_mode=self.config.onnx_padding_mode,
             padding_secs=self.config.onnx_padding_secs,
+            graph_opt_level=self.config.onnx_graph_opt_level,
         )
 
         # 2. GGUF
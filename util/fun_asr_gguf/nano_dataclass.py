@@ -151,6 +151,7 @@ class ASREngineConfig:
     metal_enable: bool = True
     onnx_padding_mode: str = "auto"
     onnx_padding_secs: int = 30
+    onnx_graph_opt_level: int = 2
     vulkan_enable: bool = True
     vulkan_force_fp32: bool = False
 
@@ -2,6 +2,7 @@ import onnxruntime
 import time
 import os
 import math
+import threading
 import numpy as np
 from . import logger
 
@@ -61,6 +62,144 @@ def _resolve_padding_secs(actual_samples: int, provider: str, padding_mode: str,
     return 5
 
 
+def _warmup_bucket_secs(resolved_mode: str, padding_secs: int) -> list:
+    """枚举该模式下推理会出现的全部 padding 桶（秒）。"""
+    if resolved_mode == "fixed30":
+        return [max(30, max(1, int(padding_secs)))]
+    if resolved_mode == "dynamic":
+        # 30 秒以上按实际长度补齐，无法预知，只热身离散桶
+        return [5, 10, 15, 20, 25, 30]
+    return [5]
+
+
+class _BucketBinding:
+    """单个 (session, 桶样本数) 的可复用 IoBinding 与输入缓冲。
+
+    padding 已按桶对齐（fixed5/fixed30/dynamic 5 秒步进），同一桶的
+    每次推理输入形状完全一致：预创建 IoBinding 并让输入 OrtValue
+    直接包住常驻 NumPy 缓冲，ORT 不必为每个新音频长度重新规划内存，
+    每次调用也不再重建 OrtValue。
+    """
+
+    def __init__(self, sess, target_samples, dtype, in_names, out_names):
+        self.audio_buf = np.zeros((1, 1, target_samples), dtype=dtype)
+        self.ilens_buf = np.zeros(1, dtype=np.int64)
+        # ortvalue_from_numpy 在 CPU 上零拷贝共享缓冲：写 audio_buf 即写输入
+        self.audio_ort = onnxruntime.OrtValue.ortvalue_from_numpy(self.audio_buf, 'cpu', 0)
+        self.ilens_ort = onnxruntime.OrtValue.ortvalue_from_numpy(self.ilens_buf, 'cpu', 0)
+        self.binding = sess.io_binding()
+        self.binding.bind_ortvalue_input(in_names[0], self.audio_ort)
+        if 'ilens' in in_names:
+            self.binding.bind_ortvalue_input('ilens', self.ilens_ort)
+        for name in out_names:
+            self.binding.bind_output(name, 'cpu')
+        # 缓冲中上次写入的有效样本数（np.zeros 初始即全零）
+        self.valid_samples = 0
+
+
+# 会话元数据缓存：get_inputs()/get_outputs() 每次都经 pybind11 重建
+# Python 对象列表，而元数据在会话生命周期内恒定，抓取一次即可。
+_SESSION_META: dict = {}
+
+
+def _session_meta(sess):
+    """返回 (in_names, dtype, out_names, provider)，按会话缓存。"""
+    key = id(sess)
+    meta = _SESSION_META.get(key)
+    if meta is None:
+        inputs = sess.get_inputs()
+        in_names = tuple(x.name for x in inputs)
+        dtype = np.float16 if 'float16' in inputs[0].type else np.float32
+        out_names = tuple(x.name for x in sess.get_outputs())
+        providers = sess.get_providers()
+        provider = providers[0] if providers else "CPUExecutionProvider"
+        meta = (in_names, dtype, out_names, provider)
+        _SESSION_META[key] = meta
+    return meta
+
+
+# IoBinding 缓存：key=(session id, 桶样本数)。dynamic 模式超过 30 秒
+# 按实际长度补齐、桶不再离散，不缓存以免无界增长。
+_BUCKET_BINDINGS: dict = {}
+_BUCKET_BINDINGS_LOCK = threading.Lock()
+_MAX_CACHED_BUCKET_SECS = 30
+
+
+def _get_bucket_binding(sess, target_samples, dtype, in_names, out_names):
+    key = (id(sess), target_samples)
+    bucket = _BUCKET_BINDINGS.get(key)
+    if bucket is None:
+        with _BUCKET_BINDINGS_LOCK:
+            bucket = _BUCKET_BINDINGS.get(key)
+            if bucket is None:
+                bucket = _BucketBinding(sess, target_samples, dtype, in_names, out_names)
+                _BUCKET_BINDINGS[key] = bucket
+    return bucket
+
+
+# 图优化级别映射：0/1/2 对应 ORT 标准级别，99 为全量（含布局重写）
+_GRAPH_OPT_LEVELS = {
+    0: onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL,
+    1: onnxruntime.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+    2: onnxruntime.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+    99: onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL,
+}
+
+
+def _create_session_with_opt_cache(model_path, session_opts, providers):
+    """创建会话，CPU 路径缓存优化后的图到磁盘，下次启动跳过图优化。
+
+    图优化结果对 (ORT 版本, EP, 模型内容) 确定，缓存文件按 ORT 版本
+    与模型文件的 size+mtime 命名：换模型（如 int8 与 fp16 互换、原地
+    更新同名文件）后旧缓存自然失配，不会加载到陈旧的优化图。
+    GPU EP 的图变换可能引入不可移植的节点，不做缓存。
+    """
+    if providers[0] != 'CPUExecutionProvider':
+        return onnxruntime.InferenceSession(
+            model_path,
+            sess_options=session_opts,
+            providers=providers,
+        )
+
+    st = os.stat(model_path)
+    cache_path = (
+        f"{model_path}.opt.ort{onnxruntime.__version__}"
+        f".{st.st_size}-{int(st.st_mtime)}.onnx"
+    )
+    try:
+        if os.path.exists(cache_path):
+            cached_opts = onnxruntime.SessionOptions()
+            cached_opts.add_session_config_entry("session.intra_op.allow_spinning", "0")
+            cached_opts.add_session_config_entry("session.inter_op.allow_spinning", "0")
+            cached_opts.execution_mode = session_opts.execution_mode
+            cached_opts.intra_op_num_threads = session_opts.intra_op_num_threads
+            # 图已离线优化完毕，加载时整体跳过优化阶段
+            cached_opts.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
+            return onnxruntime.InferenceSession(
+                cache_path,
+                sess_options=cached_opts,
+                providers=providers,
+            )
+
+        session_opts.optimized_model_filepath = cache_path
+        try:
+            return onnxruntime.InferenceSession(
+                model_path,
+                sess_options=session_opts,
+                providers=providers,
+            )
+        finally:
+            session_opts.optimized_model_filepath = ""
+    except Exception as e:
+        logger.warning(f"优化图缓存不可用，回退常规加载: {e}")
+        session_opts.optimized_model_filepath = ""
+        return onnxruntime.InferenceSession(
+            model_path,
+            sess_options=session_opts,
+            providers=providers,
+        )
+
+
 def load_onnx_models(
     encoder_path,
     ctc_path,
@@ -68,91 +207,121 @@ def load_onnx_models(
     dml_enable=True,
     coreml_enable=False,
     padding_mode="auto",
+    graph_opt_level=2,
 ):
     """步骤 1: 加载 ONNX 音频编码器和 CTC Head 并进行热身"""
     # print("\n[1] 加载 ONNX Models (Encoder + CTC)...")
-    
+
     t_start = time.perf_counter()
-    session_opts = onnxruntime.SessionOptions()
-    session_opts.add_session_config_entry("session.intra_op.allow_spinning", "0")
-    session_opts.add_session_config_entry("session.inter_op.allow_spinning", "0")
-    session_opts.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
-    
+
     providers = ['CPUExecutionProvider']
     if dml_enable and 'DmlExecutionProvider' in onnxruntime.get_available_providers():
-        providers.insert(0, 'DmlExecutionProvider') 
+        providers.insert(0, 'DmlExecutionProvider')
     if coreml_enable and 'CoreMLExecutionProvider' in onnxruntime.get_available_providers():
         providers.insert(0, 'CoreMLExecutionProvider')
     logger.info(f"Onnxruntime providers: {providers}")
+
+    session_opts = onnxruntime.SessionOptions()
+    session_opts.add_session_config_entry("session.intra_op.allow_spinning", "0")
+    session_opts.add_session_config_entry("session.inter_op.allow_spinning", "0")
+    session_opts.execution_mode = onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+    if providers[0] == 'CPUExecutionProvider':
+        # CPU 路径：全量图优化（level 99）在部分 x86 上反而更慢，默认
+        # EXTENDED，可经配置改回；线程数按物理核估算（逻辑核的一半），
+        # 超线程下全逻辑核易过订阅
+        session_opts.graph_optimization_level = _GRAPH_OPT_LEVELS.get(
+            int(graph_opt_level),
+            onnxruntime.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+        )
+        session_opts.intra_op_num_threads = max(1, (os.cpu_count() or 4) // 2)
+    else:
+        # DML/CoreML 依赖全量图融合，保持 ENABLE_ALL
+        session_opts.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
     
-    encoder_sess = onnxruntime.InferenceSession(
-        encoder_path, 
-        sess_options=session_opts, 
-        providers=providers
-    )
-    
-    ctc_sess = onnxruntime.InferenceSession(
-        ctc_path, 
-        sess_options=session_opts, 
-        providers=providers
-    )
+    encoder_sess = _create_session_with_opt_cache(encoder_path, session_opts, providers)
+    ctc_sess = _create_session_with_opt_cache(ctc_path, session_opts, providers)
 
     encoder_provider = encoder_sess.get_providers()[0] if encoder_sess.get_providers() else "CPUExecutionProvider"
-    warmup_padding_secs = _resolve_padding_secs(
-        actual_samples=0,
-        provider=encoder_provider,
-        padding_mode=padding_mode,
-        padding_secs=padding_secs,
-    )
     resolved_mode = _resolve_padding_mode(encoder_provider, padding_mode)
+    warmup_buckets = _warmup_bucket_secs(resolved_mode, padding_secs)
     logger.info(
         f"ONNX padding 策略: mode={padding_mode} -> {resolved_mode}, "
-        f"provider={encoder_provider}, warmup={warmup_padding_secs}s"
+        f"provider={encoder_provider}, warmup buckets={warmup_buckets}s"
     )
     
-    # Warmup
-    if warmup_padding_secs > 0:
-        # print(f"   [Warmup] Warming up with {warmup_secs}s pseudo-audio...")
-        SR = 16000
-        warmup_samples = int(SR * warmup_padding_secs)  # Ensure int
-        
-        # Encoder Warmup
-        audio_type = encoder_sess.get_inputs()[0].type
-        dtype = np.float16 if 'float16' in audio_type else np.float32
-        dummy_audio = np.zeros((1, 1, warmup_samples), dtype=dtype)
+    # Warmup：ORT 对每个新输入形状都有一次冷路径（内存规划、EP 编译），
+    # 逐桶热身一遍，正式推理不再撞上首形状慢启动
+    SR = 16000
+    audio_type = encoder_sess.get_inputs()[0].type
+    dtype = np.float16 if 'float16' in audio_type else np.float32
+    in_names = [x.name for x in encoder_sess.get_inputs()]
+    ctc_in = ctc_sess.get_inputs()[0]
+    ctc_dtype = np.float16 if 'float16' in ctc_in.type else np.float32
+
+    # 跨桶复用的零缓冲：按最大桶一次分配，各桶取前缀视图，
+    # 多桶热身不再产生 MB 级的重复分配
+    max_warmup_samples = int(SR * max(warmup_buckets))
+    warmup_audio_pool = np.zeros((1, 1, max_warmup_samples), dtype=dtype)
+    ctc_out_names = [x.name for x in ctc_sess.get_outputs()]
+
+    for bucket_secs in warmup_buckets:
+        warmup_samples = int(SR * bucket_secs)  # Ensure int
+        if warmup_samples <= 0:
+            continue
+        t_bucket = time.perf_counter()
+
+        # Encoder Warmup（前两维为 1，前缀切片仍是连续内存）
+        dummy_audio = warmup_audio_pool[:, :, :warmup_samples]
         dummy_ilens = np.array([warmup_samples], dtype=np.int64)
-        
         # New model has ['audio', 'ilens']
-        in_names = [x.name for x in encoder_sess.get_inputs()]
         if 'ilens' in in_names:
             encoder_sess.run(None, {in_names[0]: dummy_audio, in_names[1]: dummy_ilens})
         else:
             encoder_sess.run(None, {in_names[0]: dummy_audio})
-            
+
         # CTC Warmup
-        ctc_in = ctc_sess.get_inputs()[0]
-        ctc_dtype = np.float16 if 'float16' in ctc_in.type else np.float32
         # CTC input shape is [1, T, 512]
         # T_lfr = T_mel // 6, T_mel = audio // 160
         T_warmup = int(warmup_samples // 160 // 6) # Ensure int
-        dummy_enc = np.zeros((1, T_warmup, 512), dtype=ctc_dtype)
-        ctc_sess.run(None, {ctc_in.name: dummy_enc})
+        if T_warmup > 0:
+            # T 为 0 的空推理对热身无意义，仍会进 ORT 调度，直接跳过；
+            # 由 ORT 直接按形状分配，免去 NumPy 零缓冲的中转拷贝
+            dummy_enc = onnxruntime.OrtValue.ortvalue_from_shape_and_type(
+                [1, T_warmup, 512], ctc_dtype, 'cpu', 0
+            )
+            ctc_sess.run_with_ort_values(ctc_out_names, {ctc_in.name: dummy_enc})
+
+        logger.debug(
+            f"Warmup bucket {bucket_secs}s 耗时 {(time.perf_counter() - t_bucket) * 1000:.1f}ms"
+        )
 
     t_cost = time.perf_counter() - t_start
     return encoder_sess, ctc_sess, t_cost
 
 
-def encode_audio(audio, encoder_sess, padding_secs=30, padding_mode="auto"):
-    """使用 ONNX Encoder 获取 LLM 嵌入和 CTC 特征，支持自动 Padding"""
+def encode_audio(audio, encoder_sess, padding_secs=30, padding_mode="auto", embed_dtype=np.float32):
+    """使用 ONNX Encoder 获取 LLM 嵌入和 CTC 特征，支持自动 Padding
+
+    embed_dtype: LLM 嵌入的输出精度。默认升到 float32（现有 GGUF
+    解码链路的预期输入）；下游若能直接消费 FP16，传 np.float16 可
+    免去升精度拷贝，嵌入内存流量减半。
+    """
     
-    # Check expected input type
-    in_names = [x.name for x in encoder_sess.get_inputs()]
-    audio_type = encoder_sess.get_inputs()[0].type
-    dtype = np.float16 if 'float16' in audio_type else np.float32
+    # Check expected input type（元数据按会话缓存，不逐次经 pybind11 重建）
+    in_names, dtype, out_names, encoder_provider = _session_meta(encoder_sess)
 
     actual_samples = len(audio)
 
-    encoder_provider = encoder_sess.get_providers()[0] if encoder_sess.get_providers() else "CPUExecutionProvider"
+    # 不足一个特征窗（约 60ms）的音频编码不出任何有效帧，下游只会
+    # 丢弃结果：直接返回空嵌入，省掉整次 padding + ORT 推理。
+    # enc_output 的 dtype 跟随会话元数据：FP16 模型下正常路径产出
+    # float16，空结果需保持一致，避免下游 CTC 按混合精度走拼接/比较
+    if actual_samples < 960:
+        return (
+            np.zeros((0, 1024), dtype=embed_dtype),
+            np.zeros((1, 0, 512), dtype=dtype),
+        )
+
     target_padding_secs = _resolve_padding_secs(
         actual_samples=actual_samples,
         provider=encoder_provider,
@@ -160,29 +329,44 @@ def encode_audio(audio, encoder_sess, padding_secs=30, padding_mode="auto"):
         padding_secs=padding_secs,
     )
     target_samples = int(target_padding_secs * 16000)
-    
-    if actual_samples < target_samples:
-        padded_audio = np.zeros(target_samples, dtype=audio.dtype)
-        padded_audio[:actual_samples] = audio
-        audio = padded_audio
-    
-    audio_input = audio.astype(dtype).reshape(1, 1, -1)
-    ilens_input = np.array([actual_samples], dtype=np.int64)
-    
-    out_names = [x.name for x in encoder_sess.get_outputs()]
-    
-    # 构造输入 Feed
-    if 'ilens' in in_names:
-        input_feed = {
-            in_names[0]: onnxruntime.OrtValue.ortvalue_from_numpy(audio_input, 'cpu', 0),
-            'ilens': onnxruntime.OrtValue.ortvalue_from_numpy(ilens_input, 'cpu', 0)
-        }
+
+    if actual_samples <= target_samples and target_padding_secs <= _MAX_CACHED_BUCKET_SECS:
+        # 桶内路径：复用固定形状的 IoBinding 与输入缓冲
+        bucket = _get_bucket_binding(encoder_sess, target_samples, dtype, in_names, out_names)
+        buf = bucket.audio_buf[0, 0]
+        buf[:actual_samples] = audio
+        # 尾部静音只需覆盖上次残留的有效区间，而非整段 target_samples；
+        # 等长复用时（常见于满桶流式切片）完全跳过清零
+        prev_valid = bucket.valid_samples
+        if prev_valid > actual_samples:
+            buf[actual_samples:prev_valid] = 0.0
+        bucket.valid_samples = actual_samples
+        bucket.ilens_buf[0] = actual_samples
+        encoder_sess.run_with_iobinding(bucket.binding)
+        outputs = bucket.binding.get_outputs()
     else:
-        input_feed = {
-            in_names[0]: onnxruntime.OrtValue.ortvalue_from_numpy(audio_input, 'cpu', 0)
-        }
-    
-    outputs = encoder_sess.run_with_ort_values(out_names, input_feed)
+        # 一次性路径：超过 30s 的动态补齐，或实际长度超出所配桶容量
+        # （如 fixed5 桶遇到 >5s 片段、fixed30 遇到 >30s 切片）——
+        # 后者与基线一致按实际长度不补齐推理，形状不可复用不入桶
+        if actual_samples < target_samples:
+            padded_audio = np.zeros(target_samples, dtype=audio.dtype)
+            padded_audio[:actual_samples] = audio
+            audio = padded_audio
+
+        audio_input = audio.astype(dtype).reshape(1, 1, -1)
+        ilens_input = np.array([actual_samples], dtype=np.int64)
+
+        if 'ilens' in in_names:
+            input_feed = {
+                in_names[0]: onnxruntime.OrtValue.ortvalue_from_numpy(audio_input, 'cpu', 0),
+                'ilens': onnxruntime.OrtValue.ortvalue_from_numpy(ilens_input, 'cpu', 0)
+            }
+        else:
+            input_feed = {
+                in_names[0]: onnxruntime.OrtValue.ortvalue_from_numpy(audio_input, 'cpu', 0)
+            }
+
+        outputs = encoder_sess.run_with_ort_values(list(out_names), input_feed)
     
     # Output 0: enc_output [1, T_enc, 512] (For CTC) - 不截断
     enc_output = outputs[0].numpy()
@@ -194,8 +378,15 @@ def encode_audio(audio, encoder_sess, padding_secs=30, padding_mode="auto"):
     olens_1 = 1 + (T_lfr_valid - 3 + 2) // 2
     target_len = (1 + (olens_1 - 3 + 2) // 2 - 1) // 2 + 1
     
-    audio_embd_raw = outputs[1].numpy().squeeze(0)
-    # 截断到有效值
-    audio_embd = audio_embd_raw[:target_len, :].astype(np.float32)
+    # squeeze + 截断 + astype 合并为一次有效前缀拷贝：
+    # 原路径先整块复制 [1, T_llm, 1024] 再二次复制切片/升精度，
+    # FP16 模型下是 ~3 倍于有效数据量的内存流量
+    out1 = outputs[1]
+    if hasattr(out1, 'numpy_view'):
+        audio_embd_raw = out1.numpy_view()  # 零拷贝视图
+    else:
+        audio_embd_raw = out1.numpy()
+    # 显式 copy：视图底层是 ORT 持有的输出缓冲，下次推理会被复写
+    audio_embd = np.array(audio_embd_raw[0, :target_len, :], dtype=embed_dtype, copy=True)
     
     return audio_embd, enc_output
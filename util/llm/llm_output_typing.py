@@ -7,6 +7,8 @@ LLM Typing 输出模式
 """
 import asyncio
 import platform
+import re
+import time
 from pynput import keyboard as pynput_keyboard
 
 from config_client import ClientConfig as Config
@@ -25,37 +27,66 @@ else:
 _PYNPUT_CONTROLLER = pynput_keyboard.Controller()
 _TEXT_OUTPUT = TextOutput()
 
+# 尾部 trash 字符缓存（config 支持热重载，按原始字符串作 key）
+_TRASH_CHARS_SOURCE = None
+_TRASH_CHARS = '\n'
+
+
+def _get_trash_chars() -> str:
+    global _TRASH_CHARS_SOURCE, _TRASH_CHARS
+    source = Config.trash_punc
+    if source != _TRASH_CHARS_SOURCE:
+        _TRASH_CHARS_SOURCE = source
+        _TRASH_CHARS = ''.join(set(source) | {'\n'})
+    return _TRASH_CHARS
+
+
+# 兼容关键词合并为单个正则：一次 C 级扫描替代 关键词数 x 字段数 的子串查找
+_COMPAT_KEYWORDS_RE = re.compile(
+    "weixin|wechat|微信|rustdesk|scrcpy|mstsc|remote desktop|rdp|远程桌面"
+)
+
+# 检测结果短时缓存：get_active_window_info 每次都要走 Win32/子进程，
+# 连续输出（流式打字、连发粘贴）期间前台窗口几乎不变
+_COMPAT_CACHE_TTL = 0.5
+_COMPAT_CACHE = {"value": False, "at": 0.0, "hwnd": 0}
+
+
+def _foreground_hwnd() -> int:
+    """取前台窗口句柄（仅 Windows，其余平台返回 0）。"""
+    if keyboard_lib is None:
+        return 0
+    try:
+        import ctypes
+        return int(ctypes.windll.user32.GetForegroundWindow())
+    except Exception:
+        return 0
+
 
 def _is_remote_compat_window() -> bool:
     """
     检测当前窗口是否为远控/兼容场景，需使用 remote 粘贴时序。
     """
+    now = time.monotonic()
+    hwnd = _foreground_hwnd()
+    cache = _COMPAT_CACHE
+    # Windows 下句柄变化立即失效缓存，TTL 内同窗口直接复用结果
+    if now - cache["at"] < _COMPAT_CACHE_TTL and hwnd == cache["hwnd"]:
+        return cache["value"]
+
+    value = False
     info = get_active_window_info()
-    if not info:
-        return False
-
-    compatibility_keywords = (
-        "weixin",
-        "wechat",
-        "微信",
-        "rustdesk",
-        "scrcpy",
-        "mstsc",
-        "remote desktop",
-        "rdp",
-        "远程桌面",
-    )
-    fields = (
-        str(info.get("title", "")).lower(),
-        str(info.get("class_name", "")).lower(),
-        str(info.get("process_name", "")).lower(),
-        str(info.get("app_name", "")).lower(),
-    )
-    for keyword in compatibility_keywords:
-        token = keyword.lower()
-        if any(token and token in field for field in fields):
-            return True
-    return False
+    if info:
+        joined = "\n".join(
+            str(info.get(key, ""))
+            for key in ("title", "class_name", "process_name", "app_name")
+        ).lower()
+        value = _COMPAT_KEYWORDS_RE.search(joined) is not None
+
+    cache["value"] = value
+    cache["at"] = now
+    cache["hwnd"] = hwnd
+    return value
 
 
 async def _paste_via_text_output(text: str) -> None:
@@ -128,21 +159,10 @@ async def _process_streaming(handler, role_config, content, matched_hotwords) ->
         chunks.append(chunk)
 
         full_current = pending_buffer + chunk
-        content_to_write = full_current
-        trailing = ""
-        
-        # 从右向左寻找第一个非 trash 字符
-        for i in range(len(full_current) - 1, -1, -1):
-            char = full_current[i]
-            if char == '\n' or char in Config.trash_punc:
-                continue
-            else:
-                content_to_write = full_current[:i+1]
-                trailing = full_current[i+1:]
-                break
-        else:
-            content_to_write = ""
-            trailing = full_current
+        # 尾部 trash（含换行）整段扣下暂存：rstrip 是 C 级单次调用，
+        # 替代逐字符反向扫描 + 对字符串的 O(k) in 查找
+        content_to_write = full_current.rstrip(_get_trash_chars())
+        trailing = full_current[len(content_to_write):]
 
         if content_to_write:
             logger.debug(f"output_text: keyboard.write '{content_to_write}'")
@@ -10,7 +10,7 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+import asyncio
 
 from config_server import ServerConfig as Config
 from util.server.server_classes import Task
@@ -20,7 +20,21 @@ from . import logger
 class QueueGuard:
     def __init__(self) -> None:
         self.pending_total: int = 0
-        self.pending_by_socket = defaultdict(int)
+        # 普通 dict 即可：各方法都显式处理缺失 key，defaultdict 反而
+        # 会在只读查询时隐式插入条目
+        self.pending_by_socket: dict[str, int] = {}
+        # 名额释放信号：满额拒绝时 clear，回执/断开释放名额时 set，
+        # 等待方事件驱动唤醒而非定时轮询
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self.refresh_limits()
+
+    def refresh_limits(self) -> None:
+        """缓存限流上限；配置重载后调用以刷新。"""
+        # 上限在配置加载后即为常量，缓存为实例属性，
+        # 每包音频的热路径不再逐次读 Config 类属性并重复 int() 转换
+        self._max_per_client = int(Config.queue_max_per_client)
+        self._max_total = int(Config.queue_max_total)
 
     def try_enqueue(self, task: Task) -> bool:
         """
@@ -31,54 +45,62 @@ class QueueGuard:
         - 非 final 片段应用全局和单客户端上限
         """
         socket_id = task.socket_id
-        per_client = int(self.pending_by_socket.get(socket_id, 0))
+        pbs = self.pending_by_socket
+        per_client = pbs.get(socket_id, 0)
 
         if not task.is_final:
-            if per_client >= int(Config.queue_max_per_client):
+            if per_client >= self._max_per_client:
                 logger.warning(
                     "丢弃音频片段：超过单客户端排队上限 "
                     "(socket=%s, pending=%s, limit=%s)",
                     socket_id,
                     per_client,
-                    Config.queue_max_per_client,
+                    self._max_per_client,
                 )
+                self._drained.clear()
                 return False
 
-            if self.pending_total >= int(Config.queue_max_total):
+            if self.pending_total >= self._max_total:
                 logger.warning(
                     "丢弃音频片段：超过全局排队上限 "
                     "(pending=%s, limit=%s)",
                     self.pending_total,
-                    Config.queue_max_total,
+                    self._max_total,
                 )
+                self._drained.clear()
                 return False
 
         self.pending_total += 1
-        self.pending_by_socket[socket_id] = per_client + 1
+        pbs[socket_id] = per_client + 1
         return True
 
     def on_task_done(self, socket_id: str) -> None:
         """任务完成/丢弃回执后，减少计数。"""
-        current = int(self.pending_by_socket.get(socket_id, 0))
-        if current > 0:
-            self.pending_by_socket[socket_id] = current - 1
+        pbs = self.pending_by_socket
+        current = pbs.get(socket_id, 0)
+        if current > 1:
+            pbs[socket_id] = current - 1
         else:
-            self.pending_by_socket[socket_id] = 0
-
-        if self.pending_by_socket[socket_id] <= 0:
-            self.pending_by_socket.pop(socket_id, None)
+            pbs.pop(socket_id, None)
 
         if self.pending_total > 0:
             self.pending_total -= 1
-        else:
-            self.pending_total = 0
+        self._drained.set()
+
+    async def wait_drained(self, timeout: float) -> None:
+        """等待名额释放信号（或超时返回，由调用方重试 try_enqueue）。"""
+        try:
+            await asyncio.wait_for(self._drained.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
 
     def on_socket_closed(self, socket_id: str) -> None:
         """客户端断开时，直接回收该客户端的排队占位。"""
-        removed = int(self.pending_by_socket.pop(socket_id, 0))
+        removed = self.pending_by_socket.pop(socket_id, 0)
         if removed <= 0:
             return
         self.pending_total = max(0, self.pending_total - removed)
+        self._drained.set()
         logger.info(
             "连接断开，回收排队占位 (socket=%s, removed=%s, pending_total=%s)",
             socket_id,
@@ -85,6 +85,68 @@ class Result:
     is_final: bool = False
 
 
+@dataclass
+class WireResult:
+    """
+    预编码的识别结果（仅 WS 客户端路径使用）。
+
+    识别进程内先把下发消息序列化成 JSON 字节，主进程 ws_send 直接
+    发送，省去事件循环上的字典构建与二次 JSON 编码；tokens/timestamps
+    等大字段不再随对象图 pickle 一遍，进程间传输体积也随之减半。
+    保留少量标量字段供主进程做限流回执、日志与控制台展示。
+
+    Attributes:
+        payload: 已编码的下发消息（orjson 为 bytes，stdlib 回退为 str）
+    """
+    task_id: str
+    socket_id: str
+    source: str
+    is_final: bool
+    duration: float
+    text: str
+    payload: object
+
+
+# orjson（C 实现）编码更快且直接产出 bytes；未安装时回退 stdlib json
+try:
+    import orjson
+
+    def _encode_message(message: dict) -> bytes:
+        return orjson.dumps(message, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    import json as _json
+
+    def _encode_message(message: dict) -> str:
+        return _json.dumps(message)
+
+
+def make_wire_result(result: Result) -> WireResult:
+    """在识别进程内把 Result 预编码为 WireResult"""
+    payload = _encode_message(
+        {
+            'task_id': result.task_id,
+            'duration': result.duration,
+            'time_start': result.time_start,
+            'time_submit': result.time_submit,
+            'time_complete': result.time_complete,
+            'text': result.text,               # 主要输出（简单拼接）
+            'text_accu': result.text_accu,     # 精确输出（时间戳拼接）
+            'tokens': result.tokens,
+            'timestamps': result.timestamps,
+            'is_final': result.is_final,
+        }
+    )
+    return WireResult(
+        task_id=result.task_id,
+        socket_id=result.socket_id,
+        source=result.source,
+        is_final=result.is_final,
+        duration=result.duration,
+        text=result.text,
+        payload=payload,
+    )
+
+
 @dataclass
 class QueueAck:
     """
@@ -40,5 +40,9 @@ class Cosmic:
     queue_in: Queue = Queue()
     queue_out: Queue = Queue()
 
+    # 回执专用队列（识别进程 -> 主进程）：QueueAck 只做限流登记，
+    # 走独立通道避免在突发 partial 流下与数据消息抢队列
+    queue_ack: Queue = Queue()
+
     # HTTP 转录请求等待器（task_id -> asyncio Future）
     http_waiters: Dict[str, Any] = {}
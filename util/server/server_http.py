@@ -72,6 +72,29 @@ def _parse_int(raw: Optional[str], default: int, min_value: int) -> int:
     return max(min_value, value)
 
 
+def _parse_transcribe_params(form_data: dict) -> tuple[float, float, int, str]:
+    """从表单字段解析切片/超时参数，缺省取 Config 默认值。"""
+    seg_duration = _parse_float(
+        form_data.get("seg_duration"),
+        default=float(Config.http_seg_duration),
+        min_value=1.0,
+    )
+    seg_overlap = _parse_float(
+        form_data.get("seg_overlap"),
+        default=float(Config.http_seg_overlap),
+        min_value=0.0,
+    )
+    seg_overlap = min(seg_overlap, max(0.0, seg_duration - 0.1))
+
+    timeout_secs = _parse_int(
+        form_data.get("timeout_secs"),
+        default=int(Config.http_timeout_secs),
+        min_value=5,
+    )
+    context = str(form_data.get("context", ""))
+    return seg_duration, seg_overlap, timeout_secs, context
+
+
 async def _save_upload_to_temp(field) -> tuple[Path, str]:
     """保存 multipart 上传文件到临时文件。"""
     raw_name = field.filename or "audio.bin"
@@ -79,16 +102,42 @@ async def _save_upload_to_temp(field) -> tuple[Path, str]:
     fd, temp_path = tempfile.mkstemp(prefix="capswriter_http_", suffix=suffix)
     os.close(fd)
 
+    # 磁盘写放线程池执行，大文件上传时不阻塞事件循环里的其他请求
+    loop = asyncio.get_running_loop()
     with open(temp_path, "wb") as f:
         while True:
             chunk = await field.read_chunk()
             if not chunk:
                 break
-            f.write(chunk)
+            await loop.run_in_executor(None, f.write, chunk)
 
     return Path(temp_path), raw_name
 
 
+async def _feed_ffmpeg_stdin(field, process) -> None:
+    """把 multipart 文件流直接泵入 ffmpeg stdin，免去临时文件落盘。
+
+    drain() 提供背压：ffmpeg 消费多快就收多快，上传大文件也不会把
+    整个内容堆进内存；ffmpeg 提前退出（如输入损坏）时管道断裂，
+    吞掉写端异常，由 returncode/stderr 统一报告错误。
+    """
+    stdin = process.stdin
+    try:
+        while True:
+            chunk = await field.read_chunk()
+            if not chunk:
+                break
+            stdin.write(chunk)
+            await stdin.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        pass
+    finally:
+        try:
+            stdin.close()
+        except Exception:
+            pass
+
+
 async def _enqueue_with_backpressure(task: Task, deadline: float) -> None:
     """受队列限流约束地提交任务，必要时等待。"""
     while True:
@@ -96,10 +145,13 @@ async def _enqueue_with_backpressure(task: Task, deadline: float) -> None:
             Cosmic.queue_in.put(task)
             return
 
-        if time.time() >= deadline:
+        remaining = deadline - time.time()
+        if remaining <= 0:
             raise TimeoutError("queue backpressure timeout")
 
-        await asyncio.sleep(0.05)
+        # 事件驱动等待名额释放，免去 50ms 定时轮询的附加延迟与空转唤醒；
+        # 封顶 1s 兜底重试，防止信号丢失时卡死
+        await queue_guard.wait_drained(timeout=min(remaining, 1.0))
 
 
 def _result_to_response(result: Result, task_id: str, filename: str) -> dict:
@@ -119,6 +171,32 @@ def _result_to_response(result: Result, task_id: str, filename: str) -> dict:
     }
 
 
+def _resample_to_target(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+    """重采样到识别采样率。
+
+    优先走 SciPy 多相 FIR（C 向量化、带抗混叠，常见比率如 44100->16000
+    远快于逐样本线性插值）；SciPy 不可用时回退 np.interp 保持原行为。
+    """
+    try:
+        from math import gcd
+
+        from scipy.signal import resample_poly
+
+        g = gcd(int(AudioFormat.SAMPLE_RATE), int(sample_rate))
+        resampled = resample_poly(
+            samples,
+            int(AudioFormat.SAMPLE_RATE) // g,
+            int(sample_rate) // g,
+        )
+        return resampled.astype(np.float32, copy=False)
+    except ImportError:
+        duration = len(samples) / float(sample_rate)
+        target_len = max(1, int(duration * AudioFormat.SAMPLE_RATE))
+        x_old = np.linspace(0.0, 1.0, num=len(samples), endpoint=False)
+        x_new = np.linspace(0.0, 1.0, num=target_len, endpoint=False)
+        return np.interp(x_new, x_old, samples).astype(np.float32)
+
+
 def _decode_wav_to_float32_bytes(file_path: Path) -> bytes:
     """
     在无 ffmpeg 时，回退解析 WAV（PCM）并转为 float32/16k/mono。
@@ -130,13 +208,21 @@ def _decode_wav_to_float32_bytes(file_path: Path) -> bytes:
         frame_count = wav.getnframes()
         raw_data = wav.readframes(frame_count)
 
+    # astype + 除法会各写一遍全量 float32，改为单次分配 + ufunc out=
+    # 原地缩放，长文件少一整轮内存带宽
     if sample_width == 1:
-        samples = np.frombuffer(raw_data, dtype=np.uint8).astype(np.float32)
-        samples = (samples - 128.0) / 128.0
+        src = np.frombuffer(raw_data, dtype=np.uint8)
+        samples = np.empty(len(src), dtype=np.float32)
+        np.subtract(src, np.float32(128.0), out=samples, casting="unsafe")
+        samples *= np.float32(1.0 / 128.0)
     elif sample_width == 2:
-        samples = np.frombuffer(raw_data, dtype=np.int16).astype(np.float32) / 32768.0
+        src = np.frombuffer(raw_data, dtype=np.int16)
+        samples = np.empty(len(src), dtype=np.float32)
+        np.multiply(src, np.float32(1.0 / 32768.0), out=samples, casting="unsafe")
     elif sample_width == 4:
-        samples = np.frombuffer(raw_data, dtype=np.int32).astype(np.float32) / 2147483648.0
+        src = np.frombuffer(raw_data, dtype=np.int32)
+        samples = np.empty(len(src), dtype=np.float32)
+        np.multiply(src, np.float32(1.0 / 2147483648.0), out=samples, casting="unsafe")
     else:
         raise RuntimeError(f"unsupported WAV sample width: {sample_width}")
 
@@ -144,29 +230,34 @@ def _decode_wav_to_float32_bytes(file_path: Path) -> bytes:
         usable = (len(samples) // channels) * channels
         if usable == 0:
             return b""
-        samples = samples[:usable].reshape(-1, channels).mean(axis=1)
+        # sum(dtype=float32) + 标量乘：避开 mean 的 float64 中间结果
+        samples = samples[:usable].reshape(-1, channels).sum(axis=1, dtype=np.float32)
+        samples *= np.float32(1.0 / channels)
 
     if sample_rate != AudioFormat.SAMPLE_RATE and len(samples) > 1:
-        duration = len(samples) / float(sample_rate)
-        target_len = max(1, int(duration * AudioFormat.SAMPLE_RATE))
-        x_old = np.linspace(0.0, 1.0, num=len(samples), endpoint=False)
-        x_new = np.linspace(0.0, 1.0, num=target_len, endpoint=False)
-        samples = np.interp(x_new, x_old, samples).astype(np.float32)
+        samples = _resample_to_target(samples, sample_rate)
 
     samples = np.clip(samples, -1.0, 1.0).astype(np.float32, copy=False)
     return samples.tobytes()
 
 
 async def _transcribe_file_via_queue(
-    file_path: Path,
+    file_path: Optional[Path],
     filename: str,
     context: str,
     seg_duration: float,
     seg_overlap: float,
     timeout_secs: int,
+    upload_field=None,
 ) -> dict:
-    """将文件转码并按既有切片策略送入识别队列，等待最终结果。"""
+    """将文件转码并按既有切片策略送入识别队列，等待最终结果。
+
+    upload_field 不为 None 时走流式直通：ffmpeg 从 pipe:0 读上传流，
+    不落临时文件；否则按 file_path 读磁盘文件（WAV 回退仅支持此路径）。
+    """
     ffmpeg = _find_ffmpeg()
+    if upload_field is not None and not ffmpeg:
+        raise RuntimeError("streaming upload requires ffmpeg")
 
     task_id = str(uuid.uuid1())
     socket_id = f"http-{uuid.uuid4()}"
@@ -186,22 +277,39 @@ async def _transcribe_file_via_queue(
     threshold_bytes = AudioFormat.seconds_to_bytes(seg_threshold)
     segment_bytes = AudioFormat.seconds_to_bytes(seg_duration + seg_overlap)
     stride_bytes = AudioFormat.seconds_to_bytes(seg_duration)
-    read_size = AudioFormat.seconds_to_bytes(8)
+    # 32 秒（约 2MB）一读：读取循环每小时音频只迭代百余次
+    read_size = AudioFormat.seconds_to_bytes(32)
+
+    # 切片循环按段执行、长文件可达数百段：把循环内的全局/属性查找
+    # 绑定为局部名（LOAD_GLOBAL/LOAD_ATTR -> LOAD_FAST）
+    make_task = Task
+    enqueue = _enqueue_with_backpressure
+    now = time.time
 
     process = None
-    cache = b""
+    # bytes 的 `cache += chunk` / `cache[stride:]` 都是整段复制，长文件
+    # 下聚合成 O(N²)；改为 bytearray + 读头偏移，消费只推进 head，
+    # 已消费区间过半时才压缩一次，摊薄整理成本
+    cache = bytearray()
+    head = 0
     offset = 0.0
 
+    feeder_task = None
     try:
         if ffmpeg:
+            if upload_field is not None:
+                input_args = ("-i", "pipe:0")
+                stdin_mode = asyncio.subprocess.PIPE
+            else:
+                input_args = ("-nostdin", "-i", str(file_path))
+                stdin_mode = None
+
             process = await asyncio.create_subprocess_exec(
                 ffmpeg,
-                "-nostdin",
                 "-hide_banner",
                 "-loglevel",
                 "error",
-                "-i",
-                str(file_path),
+                *input_args,
                 "-f",
                 "f32le",
                 "-ac",
@@ -209,10 +317,24 @@ async def _transcribe_file_via_queue(
                 "-ar",
                 str(AudioFormat.SAMPLE_RATE),
                 "-",
+                stdin=stdin_mode,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
 
+            # 流式直通：写端独立成任务，与下方 stdout 消费循环并发，
+            # 否则 stdin 写满管道缓冲后会与 stdout 互相卡死
+            if upload_field is not None:
+                feeder_task = asyncio.create_task(
+                    _feed_ffmpeg_stdin(upload_field, process)
+                )
+
+            # stderr 并发排空：串行读在 ffmpeg 报错超过管道缓冲（64KB）时
+            # 会与 stdout 互相卡死；并发读同时让收尾少等一轮
+            stderr_task = None
+            if process.stderr is not None:
+                stderr_task = asyncio.create_task(process.stderr.read())
+
             while True:
                 if process.stdout is None:
                     raise RuntimeError("ffmpeg stdout unavailable")
@@ -221,13 +343,13 @@ async def _transcribe_file_via_queue(
                 if not chunk:
                     break
 
-                cache += chunk
+                cache.extend(chunk)
 
-                while len(cache) >= threshold_bytes:
-                    segment_data = cache[:segment_bytes]
-                    cache = cache[stride_bytes:]
+                while len(cache) - head >= threshold_bytes:
+                    segment_data = bytes(memoryview(cache)[head:head + segment_bytes])
+                    head += stride_bytes
 
-                    task = Task(
+                    task = make_task(
                         source="file",
                         data=segment_data,
                         offset=offset,
@@ -236,15 +358,23 @@ async def _transcribe_file_via_queue(
                         overlap=seg_overlap,
                         is_final=False,
                         time_start=time_start,
-                        time_submit=time.time(),
+                        time_submit=now(),
                         context=context,
                     )
-                    await _enqueue_with_backpressure(task, deadline)
+                    await enqueue(task, deadline)
                     offset += seg_duration
 
+                if head > len(cache) // 2:
+                    del cache[:head]
+                    head = 0
+
+            if feeder_task is not None:
+                await feeder_task
+                feeder_task = None
+
             stderr_data = b""
-            if process.stderr is not None:
-                stderr_data = await process.stderr.read()
+            if stderr_task is not None:
+                stderr_data = await stderr_task
 
             return_code = await process.wait()
             if return_code != 0:
@@ -254,12 +384,13 @@ async def _transcribe_file_via_queue(
             if file_path.suffix.lower() != ".wav":
                 raise RuntimeError("ffmpeg not found, only WAV upload is supported in fallback mode")
 
-            cache += _decode_wav_to_float32_bytes(file_path)
-            while len(cache) >= threshold_bytes:
-                segment_data = cache[:segment_bytes]
-                cache = cache[stride_bytes:]
+            # NumPy 解码/重采样可达数百毫秒，放线程池避免卡住事件循环
+            cache.extend(await asyncio.to_thread(_decode_wav_to_float32_bytes, file_path))
+            while len(cache) - head >= threshold_bytes:
+                segment_data = bytes(memoryview(cache)[head:head + segment_bytes])
+                head += stride_bytes
 
-                task = Task(
+                task = make_task(
                     source="file",
                     data=segment_data,
                     offset=offset,
@@ -268,15 +399,15 @@ async def _transcribe_file_via_queue(
                     overlap=seg_overlap,
                     is_final=False,
                     time_start=time_start,
-                    time_submit=time.time(),
+                    time_submit=now(),
                     context=context,
                 )
-                await _enqueue_with_backpressure(task, deadline)
+                await enqueue(task, deadline)
                 offset += seg_duration
 
         final_task = Task(
             source="file",
-            data=cache,
+            data=bytes(memoryview(cache)[head:]),
             offset=offset,
             task_id=task_id,
             socket_id=socket_id,
@@ -295,6 +426,9 @@ async def _transcribe_file_via_queue(
     finally:
         Cosmic.http_waiters.pop(task_id, None)
 
+        if feeder_task is not None:
+            feeder_task.cancel()
+
         if process and process.returncode is None:
             process.terminate()
             await process.wait()
@@ -325,6 +459,9 @@ async def transcript_handler(request: web.Request) -> web.Response:
         reader = await request.multipart()
         form_data: dict[str, str] = {}
         filename = "audio.bin"
+        ffmpeg_available = bool(_find_ffmpeg())
+        response_payload: Optional[dict] = None
+        ignored_fields: list[str] = []
 
         while True:
             part = await reader.next()
@@ -332,34 +469,64 @@ async def transcript_handler(request: web.Request) -> web.Response:
                 break
 
             if part.name == "file":
-                temp_file, filename = await _save_upload_to_temp(part)
+                if ffmpeg_available and response_payload is None:
+                    # 流式直通：上传流直接喂给 ffmpeg stdin，不落临时文件。
+                    # multipart 只能顺序消费，此处只认文件之前出现的参数字段
+                    filename = part.filename or "audio.bin"
+                    seg_duration, seg_overlap, timeout_secs, context = (
+                        _parse_transcribe_params(form_data)
+                    )
+                    logger.info(
+                        "HTTP 转录请求(流式): file=%s seg=%.2fs overlap=%.2fs timeout=%ss",
+                        filename,
+                        seg_duration,
+                        seg_overlap,
+                        timeout_secs,
+                    )
+                    response_payload = await _transcribe_file_via_queue(
+                        file_path=None,
+                        filename=filename,
+                        context=context,
+                        seg_duration=seg_duration,
+                        seg_overlap=seg_overlap,
+                        timeout_secs=timeout_secs,
+                        upload_field=part,
+                    )
+                else:
+                    temp_file, filename = await _save_upload_to_temp(part)
             else:
-                form_data[part.name] = await part.text()
+                value = await part.text()
+                if response_payload is None:
+                    form_data[part.name] = value
+                else:
+                    # 流式直通已按 file 之前的字段启动识别，此处字段不再
+                    # 生效；记录下来随响应返回，避免静默丢参
+                    ignored_fields.append(part.name)
+
+        if response_payload is not None:
+            if ignored_fields:
+                logger.warning(
+                    "HTTP 转录: 流式直通模式忽略了 file 之后的参数字段 %s，"
+                    "请把参数字段放在 file 之前",
+                    ignored_fields,
+                )
+                response_payload["ignored_fields"] = ignored_fields
+                response_payload["warning"] = (
+                    "multipart fields after 'file' are ignored in streaming mode; "
+                    "place parameter fields before 'file'"
+                )
+            return web.json_response(response_payload)
 
+        # 回退路径：无 ffmpeg，仅支持 WAV 临时文件
         if temp_file is None or not temp_file.exists() or temp_file.stat().st_size == 0:
             return web.json_response(
                 {"ok": False, "error": "missing file field or empty file"},
                 status=400,
             )
 
-        seg_duration = _parse_float(
-            form_data.get("seg_duration"),
-            default=float(Config.http_seg_duration),
-            min_value=1.0,
-        )
-        seg_overlap = _parse_float(
-            form_data.get("seg_overlap"),
-            default=float(Config.http_seg_overlap),
-            min_value=0.0,
-        )
-        seg_overlap = min(seg_overlap, max(0.0, seg_duration - 0.1))
-
-        timeout_secs = _parse_int(
-            form_data.get("timeout_secs"),
-            default=int(Config.http_timeout_secs),
-            min_value=5,
+        seg_duration, seg_overlap, timeout_secs, context = (
+            _parse_transcribe_params(form_data)
         )
-        context = str(form_data.get("context", ""))
 
         logger.info(
             "HTTP 转录请求: file=%s seg=%.2fs overlap=%.2fs timeout=%ss",
@@ -10,7 +10,7 @@ from config_server import ParaformerArgs, ModelPaths, SenseVoiceArgs, FunASRNano
 from util.server.server_check_model import check_model
 from util.server.server_cosmic import console
 from util.server.server_recognize import recognize
-from util.server.server_classes import QueueAck
+from util.server.server_classes import QueueAck, make_wire_result
 
 from . import logger
 
@@ -48,7 +48,7 @@ def signal_handler(signum, frame):
 
 
 
-def init_recognizer(queue_in: Queue, queue_out: Queue, sockets_id, stdin_fn):
+def init_recognizer(queue_in: Queue, queue_out: Queue, queue_ack: Queue, sockets_id, stdin_fn):
     global _resources_initialized
 
     logger.info("识别子进程启动")
@@ -180,7 +180,8 @@ def init_recognizer(queue_in: Queue, queue_out: Queue, sockets_id, stdin_fn):
                     wait_secs,
                     Config.queue_stale_secs,
                 )
-                queue_out.put(
+                # 回执走专用队列，不与数据消息抢 queue_out
+                queue_ack.put(
                     QueueAck(
                         socket_id=task.socket_id,
                         task_id=task.task_id,
@@ -191,7 +192,12 @@ def init_recognizer(queue_in: Queue, queue_out: Queue, sockets_id, stdin_fn):
                 continue
 
         result = recognize(recognizer, punc_model, task)   # 执行识别
-        queue_out.put(result)      # 返回结果
+        # WS 客户端路径：在子进程内预编码下发字节，主进程免二次序列化；
+        # HTTP 等待通道仍需完整 Result 对象，原样返回
+        if result.socket_id.startswith('http-'):
+            queue_out.put(result)
+        else:
+            queue_out.put(make_wire_result(result))
 
     # 清理完成
     logger.info("识别子进程已退出")
@@ -1,16 +1,138 @@
 import json
+import time
 import base64
 import asyncio
+import threading
 from multiprocessing import Queue
 
 from util.server.server_cosmic import console, Cosmic
-from util.server.server_classes import Result, QueueAck
+from util.server.server_classes import Result, QueueAck, WireResult
 from util.server.queue_guard import queue_guard
-from util.tools.asyncio_to_thread import to_thread
 from . import logger
-from rich import inspect
+
+# orjson（C 实现）序列化比 stdlib json 快数倍且直接产出 bytes，
+# 省去 websockets 内部的一次 UTF-8 编码（客户端 json.loads 兼容 bytes 帧）；
+# 未安装时回退 stdlib，行为不变
+try:
+    import orjson
+
+    def _dumps(message: dict) -> bytes:
+        # OPT_SERIALIZE_NUMPY：tokens/timestamps 若为 numpy 数组可免 tolist()
+        return orjson.dumps(message, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def _dumps(message: dict) -> str:
+        return json.dumps(message)
+
+
+# 小帧合并：高频流式部分结果逐条 send 时，每条都是一次 TCP 写 + WS 帧。
+# 非最终结果先进入每 socket 的 10ms 合并窗口，到点拼成一个 JSON 数组帧
+# 一次发出，显著减少系统调用次数；final 结果直发，且发送前先冲刷该
+# socket 的挂起帧，保证到达顺序
+_BATCH_WINDOW = 0.01
+_BATCH_MAX_BYTES = 64 * 1024
+
+
+class _SendBatcher:
+    """按 socket 合并非最终结果为 JSON 数组帧"""
+
+    def __init__(self, sockets: dict):
+        self._sockets = sockets
+        self._pending: dict[str, list] = {}
+        self._size: dict[str, int] = {}
+        self._handles: dict[str, asyncio.TimerHandle] = {}
+
+    def _find_socket(self, socket_id: str):
+        # 连接池本就以 str(ws.id) 为键，O(1) 取用即可
+        return self._sockets.get(socket_id)
+
+    async def add(self, socket_id: str, payload) -> None:
+        pending = self._pending.setdefault(socket_id, [])
+        pending.append(payload)
+        self._size[socket_id] = self._size.get(socket_id, 0) + len(payload)
+
+        # 攒够 64KiB 立即冲刷，否则挂一个到点冲刷的定时器
+        if self._size[socket_id] >= _BATCH_MAX_BYTES:
+            await self.flush(socket_id)
+        elif socket_id not in self._handles:
+            loop = asyncio.get_running_loop()
+            self._handles[socket_id] = loop.call_later(
+                _BATCH_WINDOW, self._flush_later, socket_id
+            )
+
+    def _flush_later(self, socket_id: str) -> None:
+        self._handles.pop(socket_id, None)
+        asyncio.ensure_future(self.flush(socket_id))
+
+    async def flush(self, socket_id: str) -> None:
+        handle = self._handles.pop(socket_id, None)
+        if handle is not None:
+            handle.cancel()
+
+        pending = self._pending.pop(socket_id, None)
+        self._size.pop(socket_id, None)
+        if not pending:
+            return
+
+        websocket = self._find_socket(socket_id)
+        if not websocket:
+            logger.warning(f"客户端 {socket_id} 不存在，丢弃 {len(pending)} 条合并结果")
+            return
+
+        if len(pending) == 1:
+            payload = pending[0]
+        elif isinstance(pending[0], bytes):
+            payload = b'[' + b','.join(pending) + b']'
+        else:
+            payload = '[' + ','.join(pending) + ']'
+
+        try:
+            await websocket.send(payload)
+        except Exception as e:
+            logger.warning(f"合并帧发送失败: socket={socket_id} err={e}")
+
+    async def flush_all(self) -> None:
+        for socket_id in list(self._pending.keys()):
+            await self.flush(socket_id)
+
+
+
+def _start_queue_pump(queue_out, loop: asyncio.AbstractEventLoop) -> asyncio.Queue:
+    """启动常驻泵线程，把多进程队列搬运进 asyncio.Queue。
+
+    原先每条消息都 to_thread(queue_out.get)，即每条一次线程池任务
+    往返；改为单个守护线程循环阻塞 get + call_soon_threadsafe 投递，
+    高频 partial 下省掉逐条的 executor 交接开销。容量不设上限：
+    在途任务数已由 queue_guard 限流。
+    """
+    async_q: asyncio.Queue = asyncio.Queue()
+
+    def _pump():
+        while True:
+            result = queue_out.get()
+            loop.call_soon_threadsafe(async_q.put_nowait, result)
+            # 保留 None 哨兵语义：投递完退出通知后泵线程随之退出
+            if result is None:
+                return
+
+    threading.Thread(target=_pump, name="ws-send-pump", daemon=True).start()
+    return async_q
 
 
+async def _ack_loop(ack_q: asyncio.Queue):
+    """专用回执消费：只做限流登记，不占用数据发送循环"""
+    while True:
+        ack = await ack_q.get()
+        if ack is None:
+            return
+        queue_guard.on_task_done(ack.socket_id)
+        if ack.dropped:
+            logger.info(
+                "片段已丢弃: task=%s socket=%s reason=%s",
+                ack.task_id,
+                ack.socket_id,
+                ack.reason,
+            )
+
 
 async def ws_send():
 
@@ -20,13 +142,29 @@ async def ws_send():
 
     logger.info("WebSocket 发送任务已启动")
 
+    loop = asyncio.get_running_loop()
+    batcher = _SendBatcher(sockets)
+    async_q = _start_queue_pump(queue_out, loop)
+
+    # 回执（QueueAck）经独立队列与消费任务处理，突发 partial 下
+    # 不再排在大体积结果之后延迟限流名额的释放
+    ack_task = asyncio.ensure_future(
+        _ack_loop(_start_queue_pump(Cosmic.queue_ack, loop))
+    )
+
+    # 转录进度行限频时间戳（rich 打印含标记解析与锁下写 stdout，
+    # 不限频时快速 partial 会在事件循环上反复卡顿）
+    last_progress = 0.0
+
     while True:
         try:
-            # 获取识别结果（从多进程队列）
-            result: Result = await to_thread(queue_out.get)
+            # 获取识别结果（从泵线程搬运的本地异步队列）
+            result: Result = await async_q.get()
 
             # 得到退出的通知
             if result is None:
+                await batcher.flush_all()
+                ack_task.cancel()
                 logger.info("收到退出通知，停止发送任务")
                 return
 
@@ -51,41 +189,57 @@ async def ws_send():
                     http_waiter.set_result(result)
                 continue
 
-            # 构建消息
-            message = {
-                'task_id': result.task_id,
-                'duration': result.duration,
-                'time_start': result.time_start,
-                'time_submit': result.time_submit,
-                'time_complete': result.time_complete,
-                'text': result.text,               # 主要输出（简单拼接）
-                'text_accu': result.text_accu,     # 精确输出（时间戳拼接）
-                'tokens': result.tokens,
-                'timestamps': result.timestamps,
-                'is_final': result.is_final,
-            }
-
-            # 获得 socket
-            websocket = next(
-                (ws for ws in sockets.values() if str(ws.id) == result.socket_id),
-                None,
-            )
+            if isinstance(result, WireResult):
+                # 识别进程已预编码，直接取下发字节
+                payload = result.payload
+            else:
+                # 兼容路径：构建消息并在主进程编码
+                message = {
+                    'task_id': result.task_id,
+                    'duration': result.duration,
+                    'time_start': result.time_start,
+                    'time_submit': result.time_submit,
+                    'time_complete': result.time_complete,
+                    'text': result.text,               # 主要输出（简单拼接）
+                    'text_accu': result.text_accu,     # 精确输出（时间戳拼接）
+                    'tokens': result.tokens,
+                    'timestamps': result.timestamps,
+                    'is_final': result.is_final,
+                }
+                payload = _dumps(message)
+
+            if not result.is_final:
+                # 部分结果进合并窗口；识别工作此刻已完成，名额立即释放
+                await batcher.add(result.socket_id, payload)
+                queue_guard.on_task_done(result.socket_id)
+            else:
+                # final 前先冲刷该 socket 的挂起帧，保证到达顺序
+                await batcher.flush(result.socket_id)
 
-            if not websocket:
+                # 连接池以 str(ws.id) 为键，直接 O(1) 取用；原先的
+                # next(...) 逐连接扫描每条消息都要 str(ws.id) 分配一次
+                websocket = sockets.get(result.socket_id)
+
+                if not websocket:
+                    queue_guard.on_task_done(result.socket_id)
+                    logger.warning(f"客户端 {result.socket_id} 不存在，跳过发送结果，任务ID: {result.task_id}")
+                    continue
+
+                # 发送消息
+                await websocket.send(payload)
                 queue_guard.on_task_done(result.socket_id)
-                logger.warning(f"客户端 {result.socket_id} 不存在，跳过发送结果，任务ID: {result.task_id}")
-                continue
 
-            # 发送消息
-            await websocket.send(json.dumps(message))
-            queue_guard.on_task_done(result.socket_id)
             logger.debug(f"发送识别结果，任务ID: {result.task_id}, 文本长度: {len(result.text)}")
 
             if result.source == 'mic':
                 console.print(f'识别结果：\n    [green]{result.text}')
                 logger.info(f"麦克风识别结果: {result.text}")
             elif result.source == 'file':
-                console.print(f'    转录进度：{result.duration:.2f}s', end='\r')
+                # 进度行限频 10Hz，final 必打
+                now_ts = time.monotonic()
+                if result.is_final or now_ts - last_progress >= 0.1:
+                    last_progress = now_ts
+                    console.print(f'    转录进度：{result.duration:.2f}s', end='\r')
                 logger.debug(f"文件转录进度: {result.duration:.2f}s")
                 if result.is_final:
                     console.print('\n    [green]转录完成')
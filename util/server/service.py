@@ -23,7 +23,8 @@ def start_recognizer_process():
     recognize_process = Process(target=init_recognizer,
                                 args=(Cosmic.queue_in,
                                       Cosmic.queue_out,
-                                      Cosmic.sockets_id, 
+                                      Cosmic.queue_ack,
+                                      Cosmic.sockets_id,
                                       stdin_fn),
                                 daemon=False)
     recognize_process.start()
@@ -11,6 +11,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import re
 import string
@@ -21,15 +22,36 @@ from urllib import error, request
 from config_server import ServerConfig as Config
 from . import logger
 
+# urllib3 连接池复用 keep-alive 连接：对同一翻译服务只握手一次，
+# 后续请求省掉整个 TCP/TLS 建连 RTT；未安装时回退 urllib.request
+# （每次请求新建连接），行为不变
+try:
+    import urllib3
+
+    _POOL = urllib3.PoolManager(maxsize=8, retries=False)
+except ImportError:
+    _POOL = None
+
 
 _CN_PREFIXES = ("请翻译为", "请翻译")
 _EN_PREFIXES = ("please translate to", "please translate")
+# 中英触发词合并成单个锚定正则（长的排前保证最长匹配），一次 C 级
+# match 替代逐前缀 startswith 循环与整串 lower() 分配
+_TRIGGER_RE = re.compile(
+    r"^(请翻译为|请翻译|please translate to|please translate)",
+    re.IGNORECASE,
+)
 _LEADING_SEPARATORS = " \t\r\n:：,，。.;；!?！？、…"
 _BRACKET_OPEN = "([{（【《<"
 _BRACKET_CLOSE = ")]}）】》>"
+# 语言别名前允许剥掉的全部字符（分隔符 + 左括号），供单次 lstrip 使用
+_ALL_LEADING = _LEADING_SEPARATORS + _BRACKET_OPEN
 _LEADING_PUNCT_CHARS = set(
     string.punctuation + "，。！？；：、…·“”‘’「」『』（）【】《》〈〉"
 )
+# lstrip 的参数是字符集合语义，与逐字符循环跳过等价；预拼出
+# 标点 + 常见空白的字符串，清理前导符号只需一次 C 级调用
+_LEADING_PUNCT_STRIP = "".join(sorted(_LEADING_PUNCT_CHARS)) + " \t\r\n\v\f\u00a0\u3000"
 
 
 _LANG_ALIASES_CN = {
@@ -87,8 +109,21 @@ _LANG_ALIASES_EN = {
     "malay": "ms",
 }
 
-_CN_ALIASES_SORTED = sorted(_LANG_ALIASES_CN.items(), key=lambda item: len(item[0]), reverse=True)
-_EN_ALIASES_SORTED = sorted(_LANG_ALIASES_EN.items(), key=lambda item: len(item[0]), reverse=True)
+def _build_len_buckets(aliases: dict) -> tuple:
+    """按别名长度分桶：匹配时只需对每个去重长度做一次 dict 查找。
+
+    线性 startswith 扫描是 O(别名数)（中文约 25 次比较）；分桶后
+    降为 O(去重长度数)，且内层查找是 C 级 dict 命中。长度降序
+    保持与原排序扫描一致的最长匹配语义。
+    """
+    buckets: dict[int, dict] = {}
+    for alias, code in aliases.items():
+        buckets.setdefault(len(alias), {})[alias] = code
+    return tuple(sorted(buckets.items(), reverse=True))
+
+
+_CN_BY_LEN = _build_len_buckets(_LANG_ALIASES_CN)
+_EN_BY_LEN = _build_len_buckets({alias.lower(): code for alias, code in _LANG_ALIASES_EN.items()})
 
 
 @dataclass
@@ -106,25 +141,7 @@ def _strip_leading_punctuation(text: str) -> str:
     """
     清理翻译结果前导标点，避免输出以标点开头。
     """
-    value = str(text or "")
-    idx = 0
-    length = len(value)
-    while idx < length:
-        ch = value[idx]
-        if ch.isspace() or ch in _LEADING_PUNCT_CHARS:
-            idx += 1
-            continue
-        break
-    return value[idx:].lstrip()
-
-
-def _strip_optional_brackets_prefix(text: str) -> str:
-    value = text.lstrip()
-    if not value:
-        return value
-    if value[0] not in _BRACKET_OPEN:
-        return value
-    return value[1:].lstrip()
+    return str(text or "").lstrip(_LEADING_PUNCT_STRIP)
 
 
 def _strip_optional_brackets_after_lang(text: str) -> str:
@@ -135,19 +152,21 @@ def _strip_optional_brackets_after_lang(text: str) -> str:
 
 
 def _match_cn_alias(rest: str) -> Optional[Tuple[str, str]]:
-    for alias, lang_code in _CN_ALIASES_SORTED:
-        if rest.startswith(alias):
-            tail = _strip_optional_brackets_after_lang(rest[len(alias):])
+    for length, bucket in _CN_BY_LEN:
+        lang_code = bucket.get(rest[:length])
+        if lang_code is not None:
+            tail = _strip_optional_brackets_after_lang(rest[length:])
             return lang_code, tail
     return None
 
 
 def _match_en_alias(rest: str) -> Optional[Tuple[str, str]]:
-    lower = rest.lower()
-    for alias, lang_code in _EN_ALIASES_SORTED:
-        if not lower.startswith(alias):
+    for length, bucket in _EN_BY_LEN:
+        # 只小写候选长度的切片，避免整串 lower() 分配
+        lang_code = bucket.get(rest[:length].lower())
+        if lang_code is None:
             continue
-        tail = rest[len(alias):]
+        tail = rest[length:]
         # 英文匹配要求别名后是边界符，避免把 "englishman" 当语言。
         if tail and (tail[0].isalnum() or tail[0] == "_"):
             continue
@@ -181,12 +200,10 @@ def _parse_target_and_content(rest: str) -> Tuple[str, str]:
     if not text:
         return "en", ""
 
-    candidates = [text, _strip_optional_brackets_prefix(text)]
-    for candidate in candidates:
-        candidate = candidate.strip()
-        if not candidate:
-            continue
-
+    # 分隔符与左括号用并集一次 lstrip 剥净（lstrip 是字符集合语义），
+    # 替代"原样 + 去一层括号"两个候选各自 strip 的多次中间串分配
+    candidate = text.lstrip(_ALL_LEADING)
+    if candidate:
         for matcher in (_match_cn_alias, _match_en_alias, _match_iso_code):
             matched = matcher(candidate)
             if matched:
@@ -196,26 +213,30 @@ def _parse_target_and_content(rest: str) -> Tuple[str, str]:
     return "en", text.strip()
 
 
+@functools.lru_cache(maxsize=256)
 def parse_translate_command(text: str) -> Optional[TranslateCommand]:
     """
     仅在句首命中翻译指令时返回解析结果。
+
+    纯函数（只依赖模块常量），lru_cache 让重复出现的指令
+    （如常用的"请翻译为英文 ..."）免去二次解析；调用方只读
+    返回的 TranslateCommand，共享缓存实例是安全的。
     """
     raw = str(text or "").strip()
     if not raw:
         return None
 
-    for prefix in _CN_PREFIXES:
-        if raw.startswith(prefix):
-            target_lang, content = _parse_target_and_content(raw[len(prefix):])
-            return TranslateCommand(target_lang=target_lang, content=content, trigger=prefix)
-
-    lower = raw.lower()
-    for prefix in _EN_PREFIXES:
-        if lower.startswith(prefix):
-            target_lang, content = _parse_target_and_content(raw[len(prefix):])
-            return TranslateCommand(target_lang=target_lang, content=content, trigger=prefix)
+    m = _TRIGGER_RE.match(raw)
+    if m is None:
+        return None
 
-    return None
+    target_lang, content = _parse_target_and_content(raw[m.end():])
+    # 英文触发词归一为小写常量形式（与原先 _EN_PREFIXES 输出一致）
+    return TranslateCommand(
+        target_lang=target_lang,
+        content=content,
+        trigger=m.group(1).lower(),
+    )
 
 
 def _http_json(
@@ -229,6 +250,25 @@ def _http_json(
     req_headers = {"Content-Type": "application/json", "Accept": "application/json"}
     if headers:
         req_headers.update(headers)
+
+    if _POOL is not None:
+        try:
+            resp = _POOL.request(
+                method, url, body=body, headers=req_headers, timeout=timeout_sec
+            )
+            # urllib3 不像 urlopen 会对 4xx/5xx 抛 HTTPError，需显式
+            # 判状态码，否则错误页 JSON 会被当成功响应解析
+            if resp.status >= 400:
+                logger.warning(f"翻译请求失败: {url} (HTTP {resp.status})")
+                return None
+            raw = resp.data.decode("utf-8", errors="replace")
+            return json.loads(raw) if raw else {}
+        except json.JSONDecodeError as e:
+            logger.warning(f"翻译请求失败: {url} ({e})")
+        except Exception as e:
+            logger.warning(f"翻译请求异常: {url} ({e})")
+        return None
+
     req = request.Request(url=url, data=body, headers=req_headers, method=method)
     try:
         with request.urlopen(req, timeout=timeout_sec) as resp:
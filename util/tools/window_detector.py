@@ -3,11 +3,64 @@
 
 检测当前前台活动的应用程序信息，用于兼容性配置
 """
+import os
+import re
+import time
 import platform
 import ctypes
+import threading
 from ctypes import wintypes
 
 
+# Windows DLL 句柄解析一次即可（非 Windows 平台无 windll，置 None，
+# 兜底实现的 try/except 会自然返回空结果）
+if platform.system() == 'Windows':
+    _USER32 = ctypes.windll.user32
+    _KERNEL32 = ctypes.windll.kernel32
+    _PSAPI = ctypes.windll.psapi
+else:
+    _USER32 = _KERNEL32 = _PSAPI = None
+
+# ctypes 缓冲按线程复用：每次查询都新建 unicode buffer / DWORD 的
+# 分配与类型构造开销，在高频轮询下相当可观
+_TLS = threading.local()
+
+
+def _win_buffers() -> dict:
+    bufs = getattr(_TLS, 'bufs', None)
+    if bufs is None:
+        bufs = _TLS.bufs = {
+            'title': ctypes.create_unicode_buffer(1024),
+            'class': ctypes.create_unicode_buffer(256),
+            'exe': ctypes.create_unicode_buffer(260),
+            'pid': wintypes.DWORD(),
+        }
+    return bufs
+
+
+# 前台窗口短 TTL 缓存（Windows）：窗口切换频率远低于查询频率，
+# hwnd 未变且未过期时直接复用结果，跳过 OpenProcess /
+# GetModuleBaseNameW / psutil 等系统调用开销
+_WINDOW_CACHE = {'hwnd': None, 'value': None, 'ts': 0.0}
+_WINDOW_CACHE_TTL = 0.5
+
+
+def _window_cache_get(hwnd):
+    if (
+        _WINDOW_CACHE['hwnd'] == hwnd
+        and time.monotonic() - _WINDOW_CACHE['ts'] < _WINDOW_CACHE_TTL
+    ):
+        return _WINDOW_CACHE['value']
+    return None
+
+
+def _window_cache_put(hwnd, value: dict) -> dict:
+    _WINDOW_CACHE['hwnd'] = hwnd
+    _WINDOW_CACHE['value'] = value
+    _WINDOW_CACHE['ts'] = time.monotonic()
+    return value
+
+
 def get_active_window_info() -> dict:
     """
     获取当前前台窗口信息
@@ -39,6 +92,10 @@ def _get_windows_window_info() -> dict:
 
         hwnd = win32gui.GetForegroundWindow()
 
+        cached = _window_cache_get(hwnd)
+        if cached is not None:
+            return cached
+
         # 获取窗口标题
         title = win32gui.GetWindowText(hwnd)
 
@@ -57,12 +114,12 @@ def _get_windows_window_info() -> dict:
         # 推测应用名称
         app_name = _guess_app_name(title, class_name, process_name)
 
-        return {
+        return _window_cache_put(hwnd, {
             'title': title,
             'class_name': class_name,
             'process_name': process_name,
             'app_name': app_name
-        }
+        })
     except ImportError:
         # 缺少 pywin32 时，回退到 ctypes 原生 WinAPI
         return _get_windows_window_info_ctypes()
@@ -74,27 +131,34 @@ def _get_windows_window_info() -> dict:
 def _get_windows_window_info_ctypes() -> dict:
     """Windows: 不依赖 pywin32 的前台窗口检测兜底实现。"""
     try:
-        user32 = ctypes.windll.user32
-        kernel32 = ctypes.windll.kernel32
-        psapi = ctypes.windll.psapi
+        user32, kernel32, psapi = _USER32, _KERNEL32, _PSAPI
 
         hwnd = user32.GetForegroundWindow()
         if not hwnd:
             return {}
 
-        # 窗口标题
+        cached = _window_cache_get(hwnd)
+        if cached is not None:
+            return cached
+
+        bufs = _win_buffers()
+
+        # 窗口标题：复用缓冲，仅在标题超长时扩容一次
         length = user32.GetWindowTextLengthW(hwnd)
-        title_buf = ctypes.create_unicode_buffer(length + 1)
+        title_buf = bufs['title']
+        if length + 1 > len(title_buf):
+            title_buf = bufs['title'] = ctypes.create_unicode_buffer(length + 1)
         user32.GetWindowTextW(hwnd, title_buf, length + 1)
         title = title_buf.value
 
         # 窗口类名
-        class_buf = ctypes.create_unicode_buffer(256)
+        class_buf = bufs['class']
         user32.GetClassNameW(hwnd, class_buf, 256)
         class_name = class_buf.value
 
         # 进程名
-        pid = wintypes.DWORD()
+        pid = bufs['pid']
+        pid.value = 0
         user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
         process_name = ""
 
@@ -105,7 +169,7 @@ def _get_windows_window_info_ctypes() -> dict:
             process_handle = kernel32.OpenProcess(access, False, pid.value)
             if process_handle:
                 try:
-                    exe_buf = ctypes.create_unicode_buffer(260)
+                    exe_buf = bufs['exe']
                     if psapi.GetModuleBaseNameW(process_handle, None, exe_buf, 260):
                         process_name = exe_buf.value
                 finally:
@@ -113,18 +177,73 @@ def _get_windows_window_info_ctypes() -> dict:
 
         app_name = _guess_app_name(title, class_name, process_name)
 
-        return {
+        return _window_cache_put(hwnd, {
             'title': title,
             'class_name': class_name,
             'process_name': process_name,
             'app_name': app_name
-        }
+        })
     except Exception:
         return {}
 
 
 def _get_macos_window_info() -> dict:
     """macOS 平台窗口检测"""
+    # 优先 pyobjc 进程内直调；不可用或失败时回退 osascript
+    info = _get_macos_window_info_pyobjc()
+    if info is not None:
+        return info
+    return _get_macos_window_info_osascript()
+
+
+def _get_macos_window_info_pyobjc():
+    """macOS: pyobjc 进程内直调。
+
+    osascript 每次轮询都要 fork 进程 + 编译/解释 AppleScript，耗时
+    数十毫秒；NSWorkspace/CGWindowListCopyWindowInfo 是进程内 API
+    调用，快一到两个数量级。pyobjc 不可用返回 None 交由兜底处理。
+    """
+    try:
+        from AppKit import NSWorkspace
+        from Quartz import (
+            CGWindowListCopyWindowInfo,
+            kCGWindowListOptionOnScreenOnly,
+            kCGWindowListExcludeDesktopElements,
+            kCGNullWindowID,
+        )
+    except ImportError:
+        return None
+
+    try:
+        app = NSWorkspace.sharedWorkspace().frontmostApplication()
+        if app is None:
+            return {}
+        app_name = str(app.localizedName() or '')
+        pid = int(app.processIdentifier())
+
+        # 取前台应用 layer 0（普通窗口层）的第一个在屏窗口标题
+        title = ''
+        windows = CGWindowListCopyWindowInfo(
+            kCGWindowListOptionOnScreenOnly | kCGWindowListExcludeDesktopElements,
+            kCGNullWindowID,
+        ) or []
+        for win in windows:
+            if win.get('kCGWindowOwnerPID') == pid and win.get('kCGWindowLayer') == 0:
+                title = str(win.get('kCGWindowName') or '')
+                break
+
+        return {
+            'title': title,
+            'class_name': '',
+            'process_name': app_name,
+            'app_name': app_name
+        }
+    except Exception:
+        return None
+
+
+def _get_macos_window_info_osascript() -> dict:
+    """macOS: osascript 子进程兜底实现。"""
     try:
         import subprocess
         from plistlib import loads
@@ -179,8 +298,103 @@ def _get_macos_window_info() -> dict:
     return {}
 
 
+# python-xlib 持久连接状态：一条 X 连接可服务全部后续轮询；
+# ImportError 记为 failed 避免每次查询重复尝试导入
+_X_STATE = {'display': None, 'failed': False}
+
+
 def _get_linux_window_info() -> dict:
     """Linux 平台窗口检测"""
+    # Wayland 会话下 X 属性不可靠，直接走 wmctrl 兜底
+    if os.environ.get('WAYLAND_DISPLAY'):
+        return _get_linux_window_info_wmctrl()
+
+    info = _get_linux_window_info_xlib()
+    if info is not None:
+        return info
+    return _get_linux_window_info_wmctrl()
+
+
+def _get_linux_window_info_xlib():
+    """Linux: python-xlib 持久连接直查。
+
+    wmctrl 每次轮询都要 fork/exec 子进程；复用一条 X 连接后，
+    取 _NET_ACTIVE_WINDOW 及窗口属性只是几个 X11 往返。
+    python-xlib 不可用或查询失败返回 None 交由兜底处理。
+    """
+    if _X_STATE['failed']:
+        return None
+    try:
+        from Xlib import X
+        from Xlib import display as xdisplay
+    except ImportError:
+        _X_STATE['failed'] = True
+        return None
+
+    try:
+        disp = _X_STATE['display']
+        if disp is None:
+            disp = _X_STATE['display'] = xdisplay.Display()
+
+        root = disp.screen().root
+        net_active = disp.intern_atom('_NET_ACTIVE_WINDOW')
+        prop = root.get_full_property(net_active, X.AnyPropertyType)
+        if not prop or not len(prop.value):
+            return {}
+        win_id = int(prop.value[0])
+        if not win_id:
+            return {}
+        win = disp.create_resource_object('window', win_id)
+
+        # 标题优先 _NET_WM_NAME（UTF-8），回退 WM_NAME
+        title = ''
+        name_prop = win.get_full_property(
+            disp.intern_atom('_NET_WM_NAME'), disp.intern_atom('UTF8_STRING')
+        )
+        if name_prop and name_prop.value:
+            raw = name_prop.value
+            title = raw.decode('utf-8', errors='replace') if isinstance(raw, bytes) else str(raw)
+        else:
+            wm_name = win.get_wm_name()
+            if wm_name:
+                title = wm_name.decode('utf-8', errors='replace') if isinstance(wm_name, bytes) else str(wm_name)
+
+        class_name = ''
+        wm_class = win.get_wm_class()
+        if wm_class:
+            class_name = wm_class[1] or wm_class[0] or ''
+
+        # 进程名经 _NET_WM_PID + /proc/<pid>/comm
+        process_name = ''
+        pid_prop = win.get_full_property(
+            disp.intern_atom('_NET_WM_PID'), X.AnyPropertyType
+        )
+        if pid_prop and len(pid_prop.value):
+            try:
+                with open(f'/proc/{int(pid_prop.value[0])}/comm') as f:
+                    process_name = f.read().strip()
+            except OSError:
+                pass
+
+        return {
+            'title': title,
+            'class_name': class_name,
+            'process_name': process_name,
+            'app_name': _guess_app_name(title, class_name, process_name)
+        }
+    except Exception:
+        # 连接失效（如 X 服务重启）时丢弃连接，下次调用重建
+        try:
+            if _X_STATE['display'] is not None:
+                _X_STATE['display'].close()
+        except Exception:
+            pass
+        _X_STATE['display'] = None
+        return None
+
+
+def _get_linux_window_info_wmctrl() -> dict:
+    """Linux: wmctrl 子进程兜底实现。"""
     try:
         import subprocess
 
@@ -254,6 +468,19 @@ def _guess_app_name(title: str, class_name: str, process_name: str) -> str:
     return ''
 
 
+# 关键词表合并为单个预编译正则（IGNORECASE），对拼接后的窗口信息
+# 做一次 C 级扫描，替代逐关键词 × 逐字段的几十次 Python 级 in 检查
+_EDITOR_KEYWORDS = [
+    'visual studio', 'vscode', 'vim', 'nano', 'emacs',
+    'notepad', 'sublime', 'atom', 'intellij', 'pycharm',
+    'webstorm', 'idea', 'editor'
+]
+_BROWSER_KEYWORDS = ['chrome', 'firefox', 'edge', 'safari', 'opera', 'brave']
+
+_EDITOR_RE = re.compile('|'.join(map(re.escape, _EDITOR_KEYWORDS)), re.IGNORECASE)
+_BROWSER_RE = re.compile('|'.join(map(re.escape, _BROWSER_KEYWORDS)), re.IGNORECASE)
+
+
 def is_likely_editor(window_info: dict) -> bool:
     """
     判断当前窗口是否可能是编辑器
@@ -267,23 +494,13 @@ def is_likely_editor(window_info: dict) -> bool:
     if not window_info:
         return True  # 默认安全起见
 
-    title = window_info.get('title', '').lower()
-    class_name = window_info.get('class_name', '').lower()
-    process_name = window_info.get('process_name', '').lower()
-
-    # 编辑器关键词
-    editor_keywords = [
-        'visual studio', 'vscode', 'vim', 'nano', 'emacs',
-        'notepad', 'sublime', 'atom', 'intellij', 'pycharm',
-        'webstorm', 'idea', 'editor'
-    ]
-
-    # 检查标题
-    for keyword in editor_keywords:
-        if keyword in title or keyword in class_name or keyword in process_name:
-            return True
-
-    return False
+    # \x00 连接符保证关键词不会跨字段误拼出来
+    haystack = '\x00'.join((
+        window_info.get('title', ''),
+        window_info.get('class_name', ''),
+        window_info.get('process_name', ''),
+    ))
+    return bool(_EDITOR_RE.search(haystack))
 
 
 def is_likely_browser(window_info: dict) -> bool:
@@ -299,13 +516,8 @@ def is_likely_browser(window_info: dict) -> bool:
     if not window_info:
         return False
 
-    class_name = window_info.get('class_name', '').lower()
-    process_name = window_info.get('process_name', '').lower()
-
-    browser_keywords = ['chrome', 'firefox', 'edge', 'safari', 'opera', 'brave']
-
-    for keyword in browser_keywords:
-        if keyword in class_name or keyword in process_name:
-            return True
-
-    return False
+    haystack = '\x00'.join((
+        window_info.get('class_name', ''),
+        window_info.get('process_name', ''),
+    ))
+    return bool(_BROWSER_RE.search(haystack))
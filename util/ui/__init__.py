@@ -14,16 +14,28 @@ class _LoggerProxy:
     """
     日志代理类（利用 __getattr__ 动态转发）
     允许先导入 logger 对象，稍后再注入真正的实现。
+
+    注入时把高频日志方法直接绑进实例 __dict__：常规属性查找
+    即可命中，热路径（toast 流式、托盘刷新）的每次日志调用
+    不再经过 __getattr__ -> getattr 两级转发（__getattr__ 只在
+    常规查找失败时触发）。
     """
+
+    _HOT_METHODS = ('debug', 'info', 'warning', 'error', 'exception', 'critical')
+
     def __init__(self):
-        self._target = logging.getLogger('util.ui')  # 默认 logger
+        self.set_target(logging.getLogger('util.ui'))  # 默认 logger
 
     def set_target(self, logger):
         """注入真正的 logger 实现"""
         self._target = logger
+        for name in self._HOT_METHODS:
+            method = getattr(logger, name, None)
+            if method is not None:
+                self.__dict__[name] = method
 
     def __getattr__(self, name):
-        """将所有属性访问转发给真正的 logger"""
+        """兜底：其余属性访问仍转发给真正的 logger"""
         return getattr(self._target, name)
 
 # 1. 创建代理实例